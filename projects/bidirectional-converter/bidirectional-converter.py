@@ -93,7 +93,8 @@ class ConversionCache:
     def _compute_hash(self, text: str, config: ConversionConfig, direction: str) -> str:
         """Compute hash for cache key"""
         cache_key = f"{direction}:{text}:{config.model}:{config.temperature}"
-        return hashlib.sha256(cache_key.encode()).hexdigest()
+        # Not a security boundary; blake2b is faster than sha256 and 128 bits is plenty
+        return hashlib.blake2b(cache_key.encode(), digest_size=16).hexdigest()
     
     def get(self, text: str, config: ConversionConfig, direction: str) -> Optional[ConversionResult]:
         """Retrieve cached conversion if available"""
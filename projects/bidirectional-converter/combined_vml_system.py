@@ -466,6 +466,11 @@ class VMLConverter:
             return f"<!-- {element.type}: {element.content} -->\n\n"
 
 
+# Patterns used by VMLLanguageHandler, compiled once at import
+_SECTION_TAG_RE = re.compile(r'^::\s*(\w+)')
+_HEADING_PREFIX_RE = re.compile(r'^#{1,6}\s+')
+
+
 class VMLLanguageHandler:
     """Handler for VML in the bidirectional converter"""
     
@@ -575,7 +580,7 @@ Focus on explaining what the document conveys and how its various features are u
             
             for i, line in enumerate(lines):
                 # Check section matching
-                if match := re.match(r'^::\s*(\w+)', line):
+                if match := _SECTION_TAG_RE.match(line):
                     if match.group(0).endswith('/'):
                         # Closing tag
                         section_name = match.group(1)
@@ -622,7 +627,7 @@ Focus on explaining what the document conveys and how its various features are u
                 if line.strip() == '---':
                     continue
                 # Ensure consistent spacing around headers
-                if re.match(r'^#{1,6}\s+', line):
+                if _HEADING_PREFIX_RE.match(line):
                     formatted_lines.append(line.strip())
                     formatted_lines.append('')  # Empty line after headers
                 else:
@@ -1090,6 +1095,14 @@ When explaining code, tailor your explanation to the specified audience level.""
 # PART 3: GUI APPLICATION
 # ============================================================================
 
+class _TextPeer(tk.Text):
+    """Text widget that shares its content store with another Text (Tk peer)"""
+    
+    def __init__(self, master, peer_of: tk.Text, cnf={}, **kw):
+        self._setup(master, cnf)
+        peer_of.tk.call(peer_of._w, 'peer', 'create', self._w, *self._options(cnf, kw))
+
+
 class ConverterGUI:
     """Main GUI application for bidirectional conversion"""
     
@@ -1100,8 +1113,14 @@ class ConverterGUI:
         
         # Initialize converter (will be set up after API key is provided)
         self.converter: Optional[BidirectionalConverter] = None
+        # (key hash, settings) the live converter was built with
+        self._last_init_key: Optional[tuple] = None
         self.current_mode = ConversionDirection.TEXT_TO_CODE
         
+        # VML tooling (validation results are cached per input)
+        self.vml_handler = VMLLanguageHandler()
+        self._validate_cache: Optional[Tuple[int, Tuple[bool, List[str]]]] = None
+        
         # Load configuration
         self.config = self._load_configuration()
         
@@ -1201,42 +1220,43 @@ class ConverterGUI:
         mode_frame.pack(side=tk.LEFT, padx=5)
         
         self.mode_var = tk.StringVar(value="text_to_code")
+        self.mode_var.trace_add("write", self._switch_mode)
         ttk.Radiobutton(
             mode_frame, text="Text → Code", 
-            variable=self.mode_var, value="text_to_code",
-            command=self._switch_mode
+            variable=self.mode_var, value="text_to_code"
         ).pack(side=tk.LEFT, padx=5)
         ttk.Radiobutton(
             mode_frame, text="Code → Text", 
-            variable=self.mode_var, value="code_to_text",
-            command=self._switch_mode
+            variable=self.mode_var, value="code_to_text"
         ).pack(side=tk.LEFT, padx=5)
         
         # Language selector
         lang_frame = ttk.LabelFrame(toolbar, text="Language")
         lang_frame.pack(side=tk.LEFT, padx=5)
         
-        self.language_var = tk.StringVar(value="python")
+        self._lang = "python"
+        self.language_var = tk.StringVar(value=self._lang)
         self.language_combo = ttk.Combobox(
             lang_frame, textvariable=self.language_var, width=15,
             values=["python", "javascript", "java", "cpp", "csharp", "go", "rust", "sql", "html", "css", "vml"]
         )
         self.language_combo.pack(padx=5, pady=5)
         
-        # VML specific buttons
-        if self.language_var.get() == "vml":
-            vml_frame = ttk.Frame(toolbar)
-            vml_frame.pack(side=tk.LEFT, padx=5)
-            
-            ttk.Button(
-                vml_frame, text="Insert Variable",
-                command=lambda: self.input_text.insert(tk.INSERT, "${}")
-            ).pack(side=tk.LEFT, padx=2)
-            
-            ttk.Button(
-                vml_frame, text="Insert Section",
-                command=lambda: self.input_text.insert(tk.INSERT, ":: section[]\n\n:: /section")
-            ).pack(side=tk.LEFT, padx=2)
+        # VML specific buttons (built once, shown only while VML is selected)
+        self._lang_frame = lang_frame
+        self._vml_toolbar = ttk.Frame(toolbar)
+        
+        ttk.Button(
+            self._vml_toolbar, text="Insert Variable",
+            command=lambda: self.input_text.insert(tk.INSERT, "${}")
+        ).pack(side=tk.LEFT, padx=2)
+        
+        ttk.Button(
+            self._vml_toolbar, text="Insert Section",
+            command=lambda: self.input_text.insert(tk.INSERT, ":: section[]\n\n:: /section")
+        ).pack(side=tk.LEFT, padx=2)
+        
+        self.language_var.trace_add("write", self._on_language_change)
         
         # Convert button
         self.convert_btn = ttk.Button(
@@ -1354,7 +1374,14 @@ class ConverterGUI:
                     max_tokens=int(self.config['API']['max_tokens']),
                     cache_enabled=self.config['Cache']['enabled'] == 'true'
                 )
-                self.converter = BidirectionalConverter(api_key, config)
+                init_key = (
+                    hashlib.sha256(api_key.encode()).hexdigest(),
+                    config.model, config.temperature, config.max_tokens, config.cache_enabled
+                )
+                # Keep the warm client unless the key or settings changed
+                if not self.converter or init_key != self._last_init_key:
+                    self.converter = BidirectionalConverter(api_key, config)
+                    self._last_init_key = init_key
                 self.api_status_var.set("API: Connected")
                 self.convert_btn.config(state=tk.NORMAL)
             except Exception as e:
@@ -1412,7 +1439,16 @@ class ConverterGUI:
         key_entry.focus_set()
         dialog.bind("<Return>", lambda e: save_key())
     
-    def _switch_mode(self):
+    def _on_language_change(self, *args):
+        """Cache the selected language and toggle the VML toolbar"""
+        self._lang = self.language_var.get()
+        
+        if self._lang == "vml":
+            self._vml_toolbar.pack(side=tk.LEFT, padx=5, after=self._lang_frame)
+        else:
+            self._vml_toolbar.pack_forget()
+    
+    def _switch_mode(self, *args):
         """Switch between conversion modes"""
         mode = self.mode_var.get()
         self.current_mode = ConversionDirection.TEXT_TO_CODE if mode == "text_to_code" else ConversionDirection.CODE_TO_TEXT
@@ -1459,14 +1495,14 @@ class ConverterGUI:
                 result = loop.run_until_complete(
                     self.converter.convert_text_to_code(
                         text=input_text,
-                        target_language=self.language_var.get()
+                        target_language=self._lang
                     )
                 )
             else:
                 result = loop.run_until_complete(
                     self.converter.convert_code_to_text(
                         code=input_text,
-                        source_language=self.language_var.get()
+                        source_language=self._lang
                     )
                 )
             
@@ -1565,7 +1601,7 @@ class ConverterGUI:
                 "css": ".css",
                 "vml": ".vml"
             }
-            default_ext = extensions.get(self.language_var.get(), ".txt")
+            default_ext = extensions.get(self._lang, ".txt")
         else:
             default_ext = ".md"
         
@@ -1607,7 +1643,7 @@ class ConverterGUI:
     
     def _load_example(self):
         """Load an example based on current mode"""
-        if self.language_var.get() == "vml":
+        if self._lang == "vml":
             if self.current_mode == ConversionDirection.TEXT_TO_CODE:
                 example = """Create a technical documentation page for a REST API.
 Include:
@@ -1685,7 +1721,7 @@ Retrieves user profile information.
                 }
             }
             
-            example = examples.get(self.current_mode, {}).get(self.language_var.get(), "")
+            example = examples.get(self.current_mode, {}).get(self._lang, "")
         
         if example:
             self.input_text.delete("1.0", tk.END)
@@ -1708,13 +1744,18 @@ Retrieves user profile information.
         editor_frame = ttk.Frame(vml_window)
         editor_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        vml_text = scrolledtext.ScrolledText(
-            editor_frame, wrap=tk.WORD, font=("Consolas", 11)
+        # Peer of the main input: edits show up in both views without copying
+        vml_text = _TextPeer(
+            editor_frame, self.input_text, wrap=tk.WORD, font=("Consolas", 11)
         )
-        vml_text.pack(fill=tk.BOTH, expand=True)
+        scrollbar = ttk.Scrollbar(editor_frame, command=vml_text.yview)
+        vml_text.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        vml_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
-        # Add sample VML content
-        vml_text.insert("1.0", self.vml_handler.get_example_code())
+        # Add sample VML content only when there is nothing to edit yet
+        if not vml_text.get("1.0", "end-1c").strip():
+            vml_text.insert("1.0", self.vml_handler.get_example_code())
         
         # Add toolbar
         toolbar = ttk.Frame(vml_window)
@@ -1740,7 +1781,13 @@ Retrieves user profile information.
     
     def _validate_vml(self, code: str):
         """Validate VML code"""
-        is_valid, errors = self.vml_handler.validate_syntax(code)
+        code_hash = hash(code)
+        if self._validate_cache and self._validate_cache[0] == code_hash:
+            is_valid, errors = self._validate_cache[1]
+        else:
+            is_valid, errors = self.vml_handler.validate_syntax(code)
+            self._validate_cache = (code_hash, (is_valid, errors))
+        
         if is_valid:
             messagebox.showinfo("Validation", "VML syntax is valid!")
         else:
@@ -10,18 +10,134 @@ from tkinter import ttk, scrolledtext, filedialog, messagebox
 import asyncio
 import threading
 import json
+import logging
+import io
 import os
+import queue
+import concurrent.futures
 from datetime import datetime
 from pathlib import Path
 import configparser
+import functools
+import hashlib
+import collections
+import types
 from typing import Optional, Dict, Any
 
 # Import the converter module
 from bidirectional_converter import (
-    BidirectionalConverter, ConversionConfig, DetailLevel,
+    BidirectionalConverter, ConversionConfig,
     ConversionDirection, ConversionResult
 )
 
+logger = logging.getLogger(__name__)
+
+
+# Palette shared by all GUI instances
+_COLORS = types.MappingProxyType({
+    'primary': '#2563eb',
+    'secondary': '#64748b',
+    'success': '#10b981',
+    'error': '#ef4444',
+    'warning': '#f59e0b',
+    'background': '#f8fafc',
+    'surface': '#ffffff',
+    'text': '#1e293b'
+})
+
+# Target languages offered in the language selector
+_LANGUAGES = ("python", "javascript", "java", "cpp", "csharp", "go", "rust", "sql", "html", "css", "vml")
+
+# Default file extension for generated code, by target language
+_EXT_BY_LANG = types.MappingProxyType({
+    "python": ".py",
+    "javascript": ".js",
+    "java": ".java",
+    "cpp": ".cpp",
+    "csharp": ".cs",
+    "go": ".go",
+    "rust": ".rs",
+    "sql": ".sql",
+    "html": ".html",
+    "css": ".css",
+    "vml": ".vml"
+})
+
+# Input examples offered by "Load Example", by mode and language
+_EXAMPLES = types.MappingProxyType({
+    ConversionDirection.TEXT_TO_CODE: {
+        "python": "Create a function that validates email addresses using regex. "
+                 "It should check for proper format and return True if valid, False otherwise.",
+        "javascript": "Create a React component for a todo list with add, delete, and toggle complete functionality.",
+        "sql": "Create a query that finds the top 5 customers by total purchase amount in the last 30 days."
+    },
+    ConversionDirection.CODE_TO_TEXT: {
+        "python": """def quicksort(arr):
+    if len(arr) <= 1:
+        return arr
+    pivot = arr[len(arr) // 2]
+    left = [x for x in arr if x < pivot]
+    middle = [x for x in arr if x == pivot]
+    right = [x for x in arr if x > pivot]
+    return quicksort(left) + middle + quicksort(right)""",
+        "javascript": """const debounce = (func, wait) => {
+  let timeout;
+  return function executedFunction(...args) {
+    const later = () => {
+      clearTimeout(timeout);
+      func(...args);
+    };
+    clearTimeout(timeout);
+    timeout = setTimeout(later, wait);
+  };
+};"""
+    }
+})
+
+
+@functools.lru_cache(maxsize=4)
+def _read_ini(path: Path, mtime_ns: int) -> configparser.ConfigParser:
+    """Parse an INI file; cached per modification time so unchanged files are not re-read"""
+    config = configparser.ConfigParser()
+    config.read(path)
+    return config
+
+
+# Per-user application files, resolved once
+_APP_DIR = Path.home() / ".bidirectional_converter"
+_CONFIG_PATH = _APP_DIR / "config.ini"
+_KEY_PATH = _APP_DIR / "api_key.txt"
+
+# Bounds (ms) for the adaptive Tk pump that delivers background results
+_PUMP_MIN_MS = 5
+_PUMP_MAX_MS = 100
+
+# Output appends are coalesced and flushed at roughly 30 Hz
+_OUTPUT_FLUSH_MS = 33
+
+# Upper bound (ms) on the delay before a repeated failure is reported
+_MAX_ERROR_DELAY_MS = 5000
+
+# Number of conversions kept in the history tab
+_HISTORY_LIMIT = 200
+
+# Input files above this size ask for confirmation before loading
+_MAX_INPUT_BYTES = 10 * 1024 * 1024
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    """Return the modification time of path, or None if it does not exist"""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _write_json(path: Path, obj: Any):
+    """Stream obj to path as compact JSON without building the whole string"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(obj, f, separators=(",", ":"))
+
 
 class ConverterGUI:
     """Main GUI application for bidirectional conversion"""
@@ -35,6 +151,43 @@ class ConverterGUI:
         self.converter: Optional[BidirectionalConverter] = None
         self.current_mode = ConversionDirection.TEXT_TO_CODE
         
+        # Persistent event loop so connections and caches survive across conversions
+        self._loop = asyncio.new_event_loop()
+        # Shared worker threads for blocking file I/O and executor work on the loop
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="conv"
+        )
+        self._loop.set_default_executor(self._pool)
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        
+        # Results from the loop thread are queued and drained by a Tk pump
+        self._ui_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._pending_jobs = 0
+        self._pump_interval = _PUMP_MIN_MS
+        self._pump_scheduled = False
+        
+        # Buffered output appends (streamed tokens and final results)
+        self._out_buffer: list = []
+        self._flush_scheduled = False
+        
+        # Number of conversions recorded in the history tab
+        self._history_count = 0
+        # Most recent history entries as (tree item, row); oldest evicted
+        self._history: collections.deque = collections.deque(maxlen=_HISTORY_LIMIT)
+        
+        # Output currently displayed, used to skip re-rendering cache hits
+        self._last_output: Optional[str] = None
+        
+        # Consecutive failed conversions, used to back off error reporting
+        self._fail_streak = 0
+        
+        # Stripped output contents keyed by widget path, dropped on <<Modified>>
+        self._text_cache: Dict[str, str] = {}
+        
+        # (config mtime, key file mtime, key hash) of the live converter
+        self._last_init_key: Optional[tuple] = None
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        
         # Load configuration
         self.config = self._load_configuration()
         
@@ -52,13 +205,11 @@ class ConverterGUI:
         
     def _load_configuration(self) -> Dict[str, Any]:
         """Load application configuration"""
-        config_path = Path.home() / ".bidirectional_converter" / "config.ini"
-        config = configparser.ConfigParser()
+        config_path = _CONFIG_PATH
         
-        if config_path.exists():
-            config.read(config_path)
-        else:
+        if not config_path.exists():
             # Create default configuration
+            config = configparser.ConfigParser()
             config['API'] = {
                 'model': 'claude-3-opus-20240229',
                 'temperature': '0.3',
@@ -67,36 +218,44 @@ class ConverterGUI:
             config['UI'] = {
                 'theme': 'default',
                 'font_size': '11',
-                'auto_convert': 'false'
+                'auto_convert': 'false',
+                'compact_metadata': 'false'
             }
             config['Cache'] = {
                 'enabled': 'true',
                 'ttl_hours': '24'
             }
             
-            # Save default config
+            # Save default config atomically so an interrupted write never leaves a torn file
+            buf = io.StringIO()
+            config.write(buf)
             config_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(config_path, 'w') as f:
-                config.write(f)
+            tmp = config_path.with_suffix('.ini.tmp')
+            tmp.write_text(buf.getvalue())
+            os.replace(tmp, config_path)
+        
+        config = _read_ini(config_path, config_path.stat().st_mtime_ns)
+        
+        # Extract the values used on hot paths once. API settings stay raw
+        # strings; _initialize_api parses them where a bad value is reported
+        self._api_model = config['API']['model']
+        self._api_temperature = config['API']['temperature']
+        self._api_max_tokens = config['API']['max_tokens']
+        try:
+            self._compact_metadata = config['UI'].getboolean('compact_metadata', fallback=False)
+        except ValueError:
+            self._compact_metadata = False
         
         return config
     
     def _setup_styles(self):
         """Configure GUI styles"""
         style = ttk.Style()
-        style.theme_use('clam')
+        if style.theme_use() != 'clam':
+            style.theme_use('clam')
         
         # Custom colors
-        self.colors = {
-            'primary': '#2563eb',
-            'secondary': '#64748b',
-            'success': '#10b981',
-            'error': '#ef4444',
-            'warning': '#f59e0b',
-            'background': '#f8fafc',
-            'surface': '#ffffff',
-            'text': '#1e293b'
-        }
+        self.colors = _COLORS
         
         # Configure styles
         style.configure('Primary.TButton', background=self.colors['primary'])
@@ -116,7 +275,7 @@ class ConverterGUI:
         file_menu.add_separator()
         file_menu.add_command(label="Export History...", command=self._export_history)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
+        file_menu.add_command(label="Exit", command=self._on_close)
         
         # Edit menu
         edit_menu = tk.Menu(menubar, tearoff=0)
@@ -167,7 +326,7 @@ class ConverterGUI:
         self.language_var = tk.StringVar(value="python")
         self.language_combo = ttk.Combobox(
             lang_frame, textvariable=self.language_var, width=15,
-            values=["python", "javascript", "java", "cpp", "csharp", "go", "rust", "sql", "html", "css", "vml"]
+            values=_LANGUAGES
         )
         self.language_combo.pack(padx=5, pady=5)
         
@@ -228,6 +387,7 @@ class ConverterGUI:
             output_tab, wrap=tk.WORD, font=("Consolas", 11)
         )
         self.output_text.pack(fill=tk.BOTH, expand=True)
+        self.output_text.bind("<<Modified>>", self._on_text_modified)
         
         # Metadata tab
         metadata_tab = ttk.Frame(self.output_notebook)
@@ -273,33 +433,26 @@ class ConverterGUI:
         self.status_bar.pack(fill=tk.X, side=tk.BOTTOM)
         
         # Status message
-        self.status_var = tk.StringVar(value="Ready")
-        self.status_label = ttk.Label(
-            self.status_bar, textvariable=self.status_var
-        )
+        self.status_label = ttk.Label(self.status_bar, text="Ready")
         self.status_label.pack(side=tk.LEFT, padx=5)
         
         # API status
-        self.api_status_var = tk.StringVar(value="API: Not initialized")
-        self.api_status_label = ttk.Label(
-            self.status_bar, textvariable=self.api_status_var
-        )
+        self.api_status_label = ttk.Label(self.status_bar, text="API: Not initialized")
         self.api_status_label.pack(side=tk.RIGHT, padx=5)
         
         # Token counter
-        self.token_var = tk.StringVar(value="Tokens: 0")
-        self.token_label = ttk.Label(
-            self.status_bar, textvariable=self.token_var
-        )
+        self.token_label = ttk.Label(self.status_bar, text="Tokens: 0")
         self.token_label.pack(side=tk.RIGHT, padx=5)
         
     def _setup_keyboard_shortcuts(self):
         """Setup keyboard shortcuts"""
-        self.root.bind("<Control-n>", lambda e: self._new_conversion())
-        self.root.bind("<Control-o>", lambda e: self._open_file())
-        self.root.bind("<Control-s>", lambda e: self._save_output())
-        self.root.bind("<Control-c>", lambda e: self._copy_output())
-        self.root.bind("<Control-l>", lambda e: self._clear_all())
+        self.root.bind("<Control-n>", self._new_conversion)
+        self.root.bind("<Control-o>", self._open_file)
+        self.root.bind("<Control-s>", self._save_output)
+        self.root.bind("<Control-c>", self._copy_output)
+        self.root.bind("<Control-l>", self._clear_all)
+        # Looked up per call: the enhanced editor swaps in its own
+        # _perform_conversion after these bindings are made
         self.root.bind("<F5>", lambda e: self._perform_conversion())
         
     def _initialize_api(self):
@@ -307,27 +460,36 @@ class ConverterGUI:
         api_key = os.getenv("ANTHROPIC_API_KEY")
         if not api_key:
             # Try to load from config file
-            key_file = Path.home() / ".bidirectional_converter" / "api_key.txt"
-            if key_file.exists():
-                api_key = key_file.read_text().strip()
+            if _KEY_PATH.exists():
+                api_key = _KEY_PATH.read_text().strip()
         
         if api_key:
+            init_key = (
+                _mtime_ns(_CONFIG_PATH),
+                _mtime_ns(_KEY_PATH),
+                hashlib.sha256(api_key.encode()).hexdigest()
+            )
+            if self.converter and init_key == self._last_init_key:
+                # Neither settings nor key changed; keep the existing client
+                return
+            
             try:
                 config = ConversionConfig(
-                    model=self.config['API']['model'],
-                    temperature=float(self.config['API']['temperature']),
-                    max_tokens=int(self.config['API']['max_tokens']),
+                    model=self._api_model,
+                    temperature=float(self._api_temperature),
+                    max_tokens=int(self._api_max_tokens),
                     cache_enabled=self.config['Cache'].getboolean('enabled')
                 )
                 self.converter = BidirectionalConverter(api_key, config)
-                self.api_status_var.set("API: Connected")
+                self._last_init_key = init_key
+                self.api_status_label.configure(text="API: Connected")
                 self.convert_btn.config(state=tk.NORMAL)
             except Exception as e:
-                self.api_status_var.set("API: Error")
+                self.api_status_label.configure(text="API: Error")
                 messagebox.showerror("API Error", f"Failed to initialize API: {str(e)}")
                 self.convert_btn.config(state=tk.DISABLED)
         else:
-            self.api_status_var.set("API: No key")
+            self.api_status_label.configure(text="API: No key")
             self.convert_btn.config(state=tk.DISABLED)
             # Prompt for API key
             self.root.after(100, self._prompt_for_api_key)
@@ -365,9 +527,8 @@ class ConverterGUI:
             api_key = key_var.get().strip()
             if api_key:
                 # Save key
-                key_file = Path.home() / ".bidirectional_converter" / "api_key.txt"
-                key_file.parent.mkdir(parents=True, exist_ok=True)
-                key_file.write_text(api_key)
+                _APP_DIR.mkdir(parents=True, exist_ok=True)
+                _KEY_PATH.write_text(api_key)
                 
                 # Reinitialize API
                 os.environ["ANTHROPIC_API_KEY"] = api_key
@@ -398,66 +559,128 @@ class ConverterGUI:
             self.input_text.delete("1.0", tk.END)
             self.input_text.insert("1.0", "Enter code here...")
     
-    def _perform_conversion(self):
-        """Perform the conversion"""
+    def _perform_conversion(self, event=None, text: Optional[str] = None):
+        """Perform the conversion, on text if given or else on the input widget"""
         if not self.converter:
             messagebox.showerror("API Error", "API not initialized. Please configure your API key.")
             return
         
-        input_text = self.input_text.get("1.0", tk.END).strip()
+        input_text = self._get_input() if text is None else text.strip()
         if not input_text:
             messagebox.showwarning("Empty Input", "Please enter some text to convert.")
             return
         
-        # Clear output
-        self.output_text.delete("1.0", tk.END)
-        self.metadata_text.delete("1.0", tk.END)
-        
         # Update status
-        self.status_var.set("Converting...")
+        self.status_label.configure(text="Converting...")
         self.convert_btn.config(state=tk.DISABLED)
         
-        # Run conversion in background thread
-        thread = threading.Thread(
-            target=self._run_conversion_async,
-            args=(input_text,)
-        )
-        thread.start()
+        # Run conversion on the background event loop
+        self._run_conversion_async(input_text)
     
     def _run_conversion_async(self, input_text: str):
-        """Run conversion in async context"""
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        """Schedule the conversion on the persistent event loop"""
+        if self.current_mode == ConversionDirection.TEXT_TO_CODE:
+            coro = self.converter.convert_text_to_code(
+                text=input_text,
+                target_language=self.language_var.get()
+            )
+        else:
+            coro = self.converter.convert_code_to_text(
+                code=input_text,
+                source_language=self.language_var.get()
+            )
         
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        self._start_job()
+        future.add_done_callback(self._on_conversion_done)
+    
+    def _on_conversion_done(self, future):
+        """Hand a finished conversion back to the Tk thread"""
         try:
-            if self.current_mode == ConversionDirection.TEXT_TO_CODE:
-                result = loop.run_until_complete(
-                    self.converter.convert_text_to_code(
-                        text=input_text,
-                        target_language=self.language_var.get()
-                    )
-                )
-            else:
-                result = loop.run_until_complete(
-                    self.converter.convert_code_to_text(
-                        code=input_text,
-                        source_language=self.language_var.get()
-                    )
-                )
-            
-            # Update UI in main thread
-            self.root.after(0, self._update_ui_with_result, result)
-            
+            result = future.result()
+        except concurrent.futures.CancelledError:
+            # Loop is shutting down with the window; nothing to report
+            return
         except Exception as e:
-            self.root.after(0, self._show_error, str(e))
+            logger.warning("Conversion failed (%s): %s", type(e).__name__, e)
+            self._post_to_ui(self._on_conversion_failed, str(e))
+        else:
+            self._post_to_ui(self._update_ui_with_result, result)
+    
+    def _post_to_ui(self, callback, *args):
+        """Queue a callback to run on the Tk thread (safe from any thread)"""
+        self._ui_queue.put((callback, args))
+    
+    def _run_in_background(self, func, *args, callback):
+        """Run a blocking call off the Tk thread; callback gets its future on the Tk thread"""
+        future = self._pool.submit(func, *args)
+        self._start_job()
+        future.add_done_callback(lambda f: self._post_to_ui(callback, f))
+    
+    def _start_job(self):
+        """Track a background job and make sure the UI pump is running"""
+        self._pending_jobs += 1
+        self._pump_interval = _PUMP_MIN_MS
+        if not self._pump_scheduled:
+            self._pump_scheduled = True
+            self.root.after(self._pump_interval, self._pump_ui_queue)
+    
+    def _pump_ui_queue(self):
+        """Drain queued callbacks, polling faster while results are arriving"""
+        delivered = False
+        try:
+            while True:
+                try:
+                    callback, args = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                self._pending_jobs -= 1
+                delivered = True
+                callback(*args)
         finally:
-            loop.close()
+            self._schedule_pump(delivered)
+    
+    def _schedule_pump(self, delivered: bool):
+        """Reschedule the UI pump, or let it lapse when no jobs remain"""
+        if self._pending_jobs <= 0 and self._ui_queue.empty():
+            self._pending_jobs = 0
+            self._pump_scheduled = False
+            return
+        
+        if delivered:
+            self._pump_interval = _PUMP_MIN_MS
+        else:
+            self._pump_interval = min(self._pump_interval * 2, _PUMP_MAX_MS)
+        self.root.after(self._pump_interval, self._pump_ui_queue)
+    
+    def _on_close(self):
+        """Stop the background event loop and close the window"""
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
     
     def _update_ui_with_result(self, result: ConversionResult):
         """Update UI with conversion result"""
+        if result.success and result.cached and result.output == self._last_output:
+            # Cache hit for what is already displayed: skip the re-render
+            self.status_label.configure(text="Conversion successful (cached)")
+            self.token_label.configure(text=f"Tokens: {result.tokens_used}")
+            self._fail_streak = 0
+            self.convert_btn.config(state=tk.NORMAL)
+            return
+        
         if result.success:
-            # Update output
-            self.output_text.insert("1.0", result.output)
+            # Replace previous output
+            self._out_buffer.clear()
+            self.output_text.delete("1.0", tk.END)
+            self.metadata_text.delete("1.0", tk.END)
+            
+            # Update output (suggestions included) with a single insert
+            output = result.output
+            if result.suggestions:
+                output += "\n\nSuggestions:\n• " + "\n• ".join(result.suggestions)
+            
+            self._append_output(output)
             
             # Update metadata
             metadata = {
@@ -468,50 +691,111 @@ class ConverterGUI:
                 "Timestamp": result.metadata.get("timestamp", "Unknown")
             }
             
-            metadata_text = json.dumps(metadata, indent=2)
+            if self._compact_metadata:
+                metadata_text = json.dumps(metadata, separators=(", ", ": "))
+            else:
+                metadata_text = json.dumps(metadata, indent=2)
             self.metadata_text.insert("1.0", metadata_text)
             
             # Update history
-            self.history_tree.insert(
+            self._history_count += 1
+            row = {
+                "time": datetime.now().strftime("%H:%M:%S"),
+                "direction": self.current_mode.value,
+                "tokens": result.tokens_used,
+                "cached": result.cached
+            }
+            if len(self._history) == _HISTORY_LIMIT:
+                self.history_tree.delete(self._history[0][0])
+            item = self.history_tree.insert(
                 "", 0,
-                text=f"Conversion {self.history_tree.get_children().__len__() + 1}",
+                text=f"Conversion {self._history_count}",
                 values=(
-                    datetime.now().strftime("%H:%M:%S"),
-                    self.current_mode.value,
-                    result.tokens_used,
+                    row["time"],
+                    row["direction"],
+                    row["tokens"],
                     "Yes" if result.cached else "No"
                 )
             )
+            self._history.append((item, row))
             
             # Update status
-            self.status_var.set("Conversion successful")
-            self.token_var.set(f"Tokens: {result.tokens_used}")
-            
-            # Show suggestions if any
-            if result.suggestions:
-                suggestions_text = "\n\nSuggestions:\n" + "\n".join(f"• {s}" for s in result.suggestions)
-                self.output_text.insert(tk.END, suggestions_text)
+            self.status_label.configure(text="Conversion successful")
+            self.token_label.configure(text=f"Tokens: {result.tokens_used}")
+            self._last_output = result.output
         else:
-            self.status_var.set("Conversion failed")
-            messagebox.showerror("Conversion Error", result.error)
+            self._on_conversion_failed(result.error)
+            return
         
+        self._fail_streak = 0
         self.convert_btn.config(state=tk.NORMAL)
     
+    def _append_output(self, text: str):
+        """Buffer text for the output widget; flushed on a fixed cadence"""
+        self._out_buffer.append(text)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.root.after(_OUTPUT_FLUSH_MS, self._flush_output)
+    
+    def _flush_output(self):
+        """Write all buffered output with a single insert"""
+        self._flush_scheduled = False
+        if not self._out_buffer:
+            return
+        
+        text = "".join(self._out_buffer)
+        self._out_buffer.clear()
+        
+        self.output_text.configure(state=tk.NORMAL, autoseparators=False)
+        self.output_text.insert(tk.END, text)
+        self.output_text.edit_reset()
+        self.output_text.configure(autoseparators=True)
+    
+    def _on_text_modified(self, event):
+        """Invalidate the cached contents of the edited widget"""
+        self._text_cache.pop(str(event.widget), None)
+        # Re-arm the flag so the next edit fires <<Modified>> again
+        event.widget.edit_modified(False)
+    
+    def _get_text(self, widget: tk.Text) -> str:
+        """Return the stripped widget contents, fetching across Tcl only after edits"""
+        key = str(widget)
+        text = self._text_cache.get(key)
+        if text is None:
+            text = widget.get("1.0", tk.END).strip()
+            self._text_cache[key] = text
+        return text
+    
+    def _get_input(self) -> str:
+        """Return the current input text"""
+        # Read directly: integrations may replace input_text with a widget that
+        # has no <<Modified>> binding, and one get per conversion is cheap
+        return self.input_text.get("1.0", tk.END).strip()
+    
+    def _on_conversion_failed(self, error_message: str):
+        """Report a failure after a delay that grows with consecutive failures"""
+        self._fail_streak += 1
+        self.status_label.configure(text="Conversion failed")
+        # Convert stays disabled until the error has been acknowledged
+        delay = min(2 ** self._fail_streak * 100, _MAX_ERROR_DELAY_MS)
+        self.root.after(delay, self._show_error, error_message)
+    
     def _show_error(self, error_message: str):
         """Show error message"""
-        self.status_var.set("Error occurred")
-        self.convert_btn.config(state=tk.NORMAL)
+        self.status_label.configure(text="Error occurred")
         messagebox.showerror("Conversion Error", error_message)
+        self.convert_btn.config(state=tk.NORMAL)
     
-    def _new_conversion(self):
+    def _new_conversion(self, event=None):
         """Start a new conversion"""
         self.input_text.delete("1.0", tk.END)
         self.output_text.delete("1.0", tk.END)
         self.metadata_text.delete("1.0", tk.END)
-        self.status_var.set("Ready")
-        self.token_var.set("Tokens: 0")
+        self._last_output = None
+        self.status_label.configure(text="Ready")
+        self.token_label.configure(text="Tokens: 0")
     
-    def _open_file(self):
+    def _open_file(self, event=None):
         """Open a file for conversion"""
         file_path = filedialog.askopenfilename(
             title="Open File",
@@ -525,38 +809,49 @@ class ConverterGUI:
         )
         
         if file_path:
+            path = Path(file_path)
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                self.input_text.delete("1.0", tk.END)
-                self.input_text.insert("1.0", content)
-                self.status_var.set(f"Loaded: {Path(file_path).name}")
-            except Exception as e:
+                size = path.stat().st_size
+            except OSError as e:
                 messagebox.showerror("File Error", f"Failed to load file: {str(e)}")
+                return
+            
+            if size > _MAX_INPUT_BYTES and not messagebox.askyesno(
+                "Large File",
+                f"{path.name} is {size / (1024 * 1024):.1f} MB. Load it anyway?"
+            ):
+                return
+            
+            # Read off the Tk thread so large files don't freeze the UI
+            self.status_label.configure(text=f"Loading: {path.name}...")
+            self._run_in_background(
+                path.read_text, 'utf-8',
+                callback=lambda future: self._finish_load(future, path)
+            )
     
-    def _save_output(self):
+    def _finish_load(self, future, path: Path):
+        """Insert a file read in the background into the input area"""
+        try:
+            content = future.result()
+        except Exception as e:
+            self.status_label.configure(text="Ready")
+            messagebox.showerror("File Error", f"Failed to load file: {str(e)}")
+            return
+        
+        self.input_text.delete("1.0", tk.END)
+        self.input_text.insert("1.0", content)
+        self.status_label.configure(text=f"Loaded: {path.name}")
+    
+    def _save_output(self, event=None):
         """Save the output to a file"""
-        output = self.output_text.get("1.0", tk.END).strip()
+        output = self._get_text(self.output_text)
         if not output:
             messagebox.showwarning("Empty Output", "No output to save.")
             return
         
         # Determine file extension based on mode and language
         if self.current_mode == ConversionDirection.TEXT_TO_CODE:
-            extensions = {
-                "python": ".py",
-                "javascript": ".js",
-                "java": ".java",
-                "cpp": ".cpp",
-                "csharp": ".cs",
-                "go": ".go",
-                "rust": ".rs",
-                "sql": ".sql",
-                "html": ".html",
-                "css": ".css",
-                "vml": ".vml"
-            }
-            default_ext = extensions.get(self.language_var.get(), ".txt")
+            default_ext = _EXT_BY_LANG.get(self.language_var.get(), ".txt")
         else:
             default_ext = ".md"
         
@@ -571,67 +866,49 @@ class ConverterGUI:
         )
         
         if file_path:
-            try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(output)
-                self.status_var.set(f"Saved: {Path(file_path).name}")
-            except Exception as e:
-                messagebox.showerror("Save Error", f"Failed to save file: {str(e)}")
+            # Encode once and write the bytes off the Tk thread
+            path = Path(file_path)
+            data = output.encode('utf-8')
+            self._run_in_background(
+                path.write_bytes, data,
+                callback=lambda future: self._finish_save(future, path)
+            )
+    
+    def _finish_save(self, future, path: Path):
+        """Report the outcome of a background save"""
+        try:
+            future.result()
+        except Exception as e:
+            messagebox.showerror("Save Error", f"Failed to save file: {str(e)}")
+            return
+        
+        self.status_label.configure(text=f"Saved: {path.name}")
     
-    def _copy_output(self):
+    def _copy_output(self, event=None):
         """Copy output to clipboard"""
-        output = self.output_text.get("1.0", tk.END).strip()
+        output = self._get_text(self.output_text)
         if output:
             self.root.clipboard_clear()
             self.root.clipboard_append(output)
-            self.status_var.set("Output copied to clipboard")
+            self.status_label.configure(text="Output copied to clipboard")
         else:
             messagebox.showwarning("Empty Output", "No output to copy.")
     
-    def _clear_all(self):
+    def _clear_all(self, event=None):
         """Clear all text areas"""
         self.input_text.delete("1.0", tk.END)
         self.output_text.delete("1.0", tk.END)
         self.metadata_text.delete("1.0", tk.END)
-        self.status_var.set("Cleared")
+        self._last_output = None
+        self.status_label.configure(text="Cleared")
     
     def _load_example(self):
         """Load an example based on current mode"""
-        examples = {
-            ConversionDirection.TEXT_TO_CODE: {
-                "python": "Create a function that validates email addresses using regex. "
-                         "It should check for proper format and return True if valid, False otherwise.",
-                "javascript": "Create a React component for a todo list with add, delete, and toggle complete functionality.",
-                "sql": "Create a query that finds the top 5 customers by total purchase amount in the last 30 days."
-            },
-            ConversionDirection.CODE_TO_TEXT: {
-                "python": """def quicksort(arr):
-    if len(arr) <= 1:
-        return arr
-    pivot = arr[len(arr) // 2]
-    left = [x for x in arr if x < pivot]
-    middle = [x for x in arr if x == pivot]
-    right = [x for x in arr if x > pivot]
-    return quicksort(left) + middle + quicksort(right)""",
-                "javascript": """const debounce = (func, wait) => {
-  let timeout;
-  return function executedFunction(...args) {
-    const later = () => {
-      clearTimeout(timeout);
-      func(...args);
-    };
-    clearTimeout(timeout);
-    timeout = setTimeout(later, wait);
-  };
-};"""
-            }
-        }
-        
-        example = examples.get(self.current_mode, {}).get(self.language_var.get(), "")
+        example = _EXAMPLES.get(self.current_mode, {}).get(self.language_var.get(), "")
         if example:
             self.input_text.delete("1.0", tk.END)
             self.input_text.insert("1.0", example)
-            self.status_var.set("Example loaded")
+            self.status_label.configure(text="Example loaded")
     
     def _format_output(self):
         """Format the output code (if applicable)"""
@@ -641,12 +918,14 @@ class ConverterGUI:
     
     def _show_options(self):
         """Show conversion options dialog"""
+        from converter_dialogs import OptionsDialog
         dialog = OptionsDialog(self.root, self.converter)
         dialog.show()
     
     def _show_api_settings(self):
         """Show API settings dialog"""
-        dialog = APISettingsDialog(self.root, self.config)
+        from converter_dialogs import APISettingsDialog
+        dialog = APISettingsDialog(self.root, self.config, _CONFIG_PATH)
         if dialog.show():
             # Reload configuration and reinitialize API
             self.config = self._load_configuration()
@@ -660,8 +939,9 @@ class ConverterGUI:
                 cache_path = Path("conversion_cache.db")
                 if cache_path.exists():
                     cache_path.unlink()
+                self._last_init_key = None
                 self._initialize_api()  # Reinitialize to create new cache
-                self.status_var.set("Cache cleared")
+                self.status_label.configure(text="Cache cleared")
     
     def _show_statistics(self):
         """Show usage statistics"""
@@ -670,8 +950,32 @@ class ConverterGUI:
     
     def _export_history(self):
         """Export conversion history"""
-        # Export history to CSV or JSON
-        messagebox.showinfo("Export", "History export functionality would be implemented here.")
+        if not self._history:
+            messagebox.showinfo("Export", "No conversions to export yet.")
+            return
+        
+        file_path = filedialog.asksaveasfilename(
+            title="Export History",
+            defaultextension=".json",
+            filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")]
+        )
+        
+        if file_path:
+            path = Path(file_path)
+            self._run_in_background(
+                _write_json, path, [row for _, row in self._history],
+                callback=lambda future: self._finish_export(future, path)
+            )
+    
+    def _finish_export(self, future, path: Path):
+        """Report the outcome of a background history export"""
+        try:
+            future.result()
+        except Exception as e:
+            messagebox.showerror("Export Error", f"Failed to export history: {str(e)}")
+            return
+        
+        self.status_label.configure(text=f"Exported history: {path.name}")
     
     def _show_documentation(self):
         """Show documentation"""
@@ -681,6 +985,7 @@ class ConverterGUI:
     
     def _show_examples(self):
         """Show examples window"""
+        from converter_dialogs import ExamplesWindow
         ExamplesWindow(self.root).show()
     
     def _show_about(self):
@@ -698,392 +1003,6 @@ class ConverterGUI:
         self._open_file()
 
 
-class OptionsDialog:
-    """Options dialog for conversion settings"""
-    
-    def __init__(self, parent, converter):
-        self.parent = parent
-        self.converter = converter
-        self.dialog = None
-        
-    def show(self):
-        """Show the options dialog"""
-        self.dialog = tk.Toplevel(self.parent)
-        self.dialog.title("Conversion Options")
-        self.dialog.geometry("500x400")
-        self.dialog.transient(self.parent)
-        
-        # Create notebook for different option categories
-        notebook = ttk.Notebook(self.dialog)
-        notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Text-to-Code options
-        t2c_frame = ttk.Frame(notebook)
-        notebook.add(t2c_frame, text="Text to Code")
-        self._create_text_to_code_options(t2c_frame)
-        
-        # Code-to-Text options
-        c2t_frame = ttk.Frame(notebook)
-        notebook.add(c2t_frame, text="Code to Text")
-        self._create_code_to_text_options(c2t_frame)
-        
-        # General options
-        general_frame = ttk.Frame(notebook)
-        notebook.add(general_frame, text="General")
-        self._create_general_options(general_frame)
-        
-        # Buttons
-        button_frame = ttk.Frame(self.dialog)
-        button_frame.pack(fill=tk.X, padx=10, pady=10)
-        
-        ttk.Button(button_frame, text="Apply", command=self._apply_options).pack(side=tk.RIGHT, padx=5)
-        ttk.Button(button_frame, text="Cancel", command=self.dialog.destroy).pack(side=tk.RIGHT)
-        
-    def _create_text_to_code_options(self, parent):
-        """Create text-to-code options"""
-        # Include comments
-        self.include_comments_var = tk.BooleanVar(value=True)
-        ttk.Checkbutton(
-            parent, text="Include comments",
-            variable=self.include_comments_var
-        ).pack(anchor=tk.W, padx=10, pady=5)
-        
-        # Include docstrings
-        self.include_docstrings_var = tk.BooleanVar(value=True)
-        ttk.Checkbutton(
-            parent, text="Include docstrings",
-            variable=self.include_docstrings_var
-        ).pack(anchor=tk.W, padx=10, pady=5)
-        
-        # Use type hints
-        self.use_type_hints_var = tk.BooleanVar(value=True)
-        ttk.Checkbutton(
-            parent, text="Use type hints (Python)",
-            variable=self.use_type_hints_var
-        ).pack(anchor=tk.W, padx=10, pady=5)
-        
-        # Follow conventions
-        self.follow_conventions_var = tk.BooleanVar(value=True)
-        ttk.Checkbutton(
-            parent, text="Follow language conventions",
-            variable=self.follow_conventions_var
-        ).pack(anchor=tk.W, padx=10, pady=5)
-        
-    def _create_code_to_text_options(self, parent):
-        """Create code-to-text options"""
-        # Detail level
-        detail_frame = ttk.LabelFrame(parent, text="Detail Level")
-        detail_frame.pack(fill=tk.X, padx=10, pady=10)
-        
-        self.detail_level_var = tk.StringVar(value="standard")
-        ttk.Radiobutton(
-            detail_frame, text="Summary",
-            variable=self.detail_level_var, value="summary"
-        ).pack(anchor=tk.W, padx=5, pady=2)
-        ttk.Radiobutton(
-            detail_frame, text="Standard",
-            variable=self.detail_level_var, value="standard"
-        ).pack(anchor=tk.W, padx=5, pady=2)
-        ttk.Radiobutton(
-            detail_frame, text="Detailed",
-            variable=self.detail_level_var, value="detailed"
-        ).pack(anchor=tk.W, padx=5, pady=2)
-        
-        # Include examples
-        self.include_examples_var = tk.BooleanVar(value=True)
-        ttk.Checkbutton(
-            parent, text="Include usage examples",
-            variable=self.include_examples_var
-        ).pack(anchor=tk.W, padx=10, pady=5)
-        
-        # Technical level
-        tech_frame = ttk.LabelFrame(parent, text="Technical Level")
-        tech_frame.pack(fill=tk.X, padx=10, pady=10)
-        
-        self.technical_level_var = tk.StringVar(value="intermediate")
-        ttk.Radiobutton(
-            tech_frame, text="Beginner",
-            variable=self.technical_level_var, value="beginner"
-        ).pack(anchor=tk.W, padx=5, pady=2)
-        ttk.Radiobutton(
-            tech_frame, text="Intermediate",
-            variable=self.technical_level_var, value="intermediate"
-        ).pack(anchor=tk.W, padx=5, pady=2)
-        ttk.Radiobutton(
-            tech_frame, text="Advanced",
-            variable=self.technical_level_var, value="advanced"
-        ).pack(anchor=tk.W, padx=5, pady=2)
-        
-    def _create_general_options(self, parent):
-        """Create general options"""
-        # Temperature
-        temp_frame = ttk.LabelFrame(parent, text="Temperature (Creativity)")
-        temp_frame.pack(fill=tk.X, padx=10, pady=10)
-        
-        self.temperature_var = tk.DoubleVar(value=0.3)
-        temp_scale = ttk.Scale(
-            temp_frame, from_=0.0, to=1.0,
-            variable=self.temperature_var, orient=tk.HORIZONTAL
-        )
-        temp_scale.pack(fill=tk.X, padx=10, pady=5)
-        
-        temp_label = ttk.Label(temp_frame, text="0.3")
-        temp_label.pack()
-        
-        def update_temp_label(value):
-            temp_label.config(text=f"{float(value):.1f}")
-        
-        temp_scale.config(command=update_temp_label)
-        
-        # Max tokens
-        tokens_frame = ttk.LabelFrame(parent, text="Max Tokens")
-        tokens_frame.pack(fill=tk.X, padx=10, pady=10)
-        
-        self.max_tokens_var = tk.IntVar(value=4096)
-        ttk.Spinbox(
-            tokens_frame, from_=100, to=8192, increment=100,
-            textvariable=self.max_tokens_var, width=10
-        ).pack(padx=10, pady=5)
-        
-    def _apply_options(self):
-        """Apply the selected options"""
-        if self.converter:
-            # Update converter configuration
-            self.converter.config.include_comments = self.include_comments_var.get()
-            self.converter.config.include_docstrings = self.include_docstrings_var.get()
-            self.converter.config.use_type_hints = self.use_type_hints_var.get()
-            self.converter.config.follow_conventions = self.follow_conventions_var.get()
-            self.converter.config.detail_level = DetailLevel(self.detail_level_var.get())
-            self.converter.config.include_examples = self.include_examples_var.get()
-            self.converter.config.technical_level = self.technical_level_var.get()
-            self.converter.config.temperature = self.temperature_var.get()
-            self.converter.config.max_tokens = self.max_tokens_var.get()
-        
-        self.dialog.destroy()
-
-
-class APISettingsDialog:
-    """API settings dialog"""
-    
-    def __init__(self, parent, config):
-        self.parent = parent
-        self.config = config
-        self.dialog = None
-        self.result = False
-        
-    def show(self):
-        """Show the API settings dialog and return True if settings were changed"""
-        self.dialog = tk.Toplevel(self.parent)
-        self.dialog.title("API Settings")
-        self.dialog.geometry("500x300")
-        self.dialog.transient(self.parent)
-        
-        # Model selection
-        model_frame = ttk.LabelFrame(self.dialog, text="Model")
-        model_frame.pack(fill=tk.X, padx=10, pady=10)
-        
-        self.model_var = tk.StringVar(value=self.config['API']['model'])
-        model_combo = ttk.Combobox(
-            model_frame, textvariable=self.model_var,
-            values=["claude-3-opus-20240229", "claude-3-sonnet-20240229", "claude-3-haiku-20240307"],
-            state="readonly", width=30
-        )
-        model_combo.pack(padx=10, pady=5)
-        
-        # Temperature
-        temp_frame = ttk.LabelFrame(self.dialog, text="Default Temperature")
-        temp_frame.pack(fill=tk.X, padx=10, pady=10)
-        
-        self.temp_var = tk.StringVar(value=self.config['API']['temperature'])
-        ttk.Entry(temp_frame, textvariable=self.temp_var, width=10).pack(padx=10, pady=5)
-        
-        # Max tokens
-        tokens_frame = ttk.LabelFrame(self.dialog, text="Default Max Tokens")
-        tokens_frame.pack(fill=tk.X, padx=10, pady=10)
-        
-        self.tokens_var = tk.StringVar(value=self.config['API']['max_tokens'])
-        ttk.Entry(tokens_frame, textvariable=self.tokens_var, width=10).pack(padx=10, pady=5)
-        
-        # Cache settings
-        cache_frame = ttk.LabelFrame(self.dialog, text="Cache")
-        cache_frame.pack(fill=tk.X, padx=10, pady=10)
-        
-        self.cache_enabled_var = tk.BooleanVar(value=self.config['Cache'].getboolean('enabled'))
-        ttk.Checkbutton(
-            cache_frame, text="Enable cache",
-            variable=self.cache_enabled_var
-        ).pack(anchor=tk.W, padx=10, pady=5)
-        
-        # Buttons
-        button_frame = ttk.Frame(self.dialog)
-        button_frame.pack(fill=tk.X, padx=10, pady=10)
-        
-        ttk.Button(button_frame, text="Save", command=self._save_settings).pack(side=tk.RIGHT, padx=5)
-        ttk.Button(button_frame, text="Cancel", command=self.dialog.destroy).pack(side=tk.RIGHT)
-        
-        # Wait for dialog to close
-        self.dialog.wait_window()
-        return self.result
-        
-    def _save_settings(self):
-        """Save the API settings"""
-        self.config['API']['model'] = self.model_var.get()
-        self.config['API']['temperature'] = self.temp_var.get()
-        self.config['API']['max_tokens'] = self.tokens_var.get()
-        self.config['Cache']['enabled'] = str(self.cache_enabled_var.get())
-        
-        # Save to file
-        config_path = Path.home() / ".bidirectional_converter" / "config.ini"
-        with open(config_path, 'w') as f:
-            self.config.write(f)
-        
-        self.result = True
-        self.dialog.destroy()
-
-
-class ExamplesWindow:
-    """Examples window showing various conversion examples"""
-    
-    def __init__(self, parent):
-        self.parent = parent
-        
-    def show(self):
-        """Show the examples window"""
-        window = tk.Toplevel(self.parent)
-        window.title("Conversion Examples")
-        window.geometry("800x600")
-        window.transient(self.parent)
-        
-        # Create notebook for different example categories
-        notebook = ttk.Notebook(window)
-        notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Add example tabs
-        self._add_text_to_code_examples(notebook)
-        self._add_code_to_text_examples(notebook)
-        
-    def _add_text_to_code_examples(self, notebook):
-        """Add text-to-code examples tab"""
-        frame = ttk.Frame(notebook)
-        notebook.add(frame, text="Text → Code")
-        
-        # Example content would go here
-        text = scrolledtext.ScrolledText(frame, wrap=tk.WORD)
-        text.pack(fill=tk.BOTH, expand=True)
-        
-        examples = """
-Text-to-Code Examples
-====================
-
-Example 1: Python Function
---------------------------
-Input: "Create a function that calculates the factorial of a number using recursion"
-
-Output:
-def factorial(n):
-    '''Calculate the factorial of a number using recursion.
-    
-    Args:
-        n (int): The number to calculate factorial for
-        
-    Returns:
-        int: The factorial of n
-        
-    Raises:
-        ValueError: If n is negative
-    '''
-    if n < 0:
-        raise ValueError("Factorial is not defined for negative numbers")
-    elif n == 0 or n == 1:
-        return 1
-    else:
-        return n * factorial(n - 1)
-
-Example 2: JavaScript Class
----------------------------
-Input: "Create a JavaScript class for a shopping cart with methods to add items, remove items, and calculate total"
-
-Output:
-class ShoppingCart {
-    constructor() {
-        this.items = [];
-    }
-    
-    addItem(item, quantity = 1, price) {
-        const existingItem = this.items.find(i => i.item === item);
-        if (existingItem) {
-            existingItem.quantity += quantity;
-        } else {
-            this.items.push({ item, quantity, price });
-        }
-    }
-    
-    removeItem(item) {
-        this.items = this.items.filter(i => i.item !== item);
-    }
-    
-    calculateTotal() {
-        return this.items.reduce((total, item) => {
-            return total + (item.quantity * item.price);
-        }, 0);
-    }
-}
-"""
-        text.insert("1.0", examples)
-        text.config(state=tk.DISABLED)
-    
-    def _add_code_to_text_examples(self, notebook):
-        """Add code-to-text examples tab"""
-        frame = ttk.Frame(notebook)
-        notebook.add(frame, text="Code → Text")
-        
-        text = scrolledtext.ScrolledText(frame, wrap=tk.WORD)
-        text.pack(fill=tk.BOTH, expand=True)
-        
-        examples = """
-Code-to-Text Examples
-====================
-
-Example 1: Algorithm Explanation
---------------------------------
-Input:
-def binary_search(arr, target):
-    left, right = 0, len(arr) - 1
-    
-    while left <= right:
-        mid = (left + right) // 2
-        if arr[mid] == target:
-            return mid
-        elif arr[mid] < target:
-            left = mid + 1
-        else:
-            right = mid - 1
-    
-    return -1
-
-Output:
-This function implements the binary search algorithm to find a target value in a sorted array.
-
-The algorithm works by:
-1. Initializing two pointers: 'left' at the start (0) and 'right' at the end of the array
-2. Repeatedly dividing the search space in half by calculating the middle index
-3. Comparing the middle element with the target value
-4. If they match, returning the index
-5. If the middle element is less than the target, searching the right half
-6. If the middle element is greater than the target, searching the left half
-7. Continuing until the element is found or the search space is empty
-
-Time Complexity: O(log n)
-Space Complexity: O(1)
-
-Example usage:
-numbers = [1, 3, 5, 7, 9, 11, 13]
-index = binary_search(numbers, 7)  # Returns 3
-"""
-        text.insert("1.0", examples)
-        text.config(state=tk.DISABLED)
-
-
 def main():
     """Main entry point"""
     root = tk.Tk()
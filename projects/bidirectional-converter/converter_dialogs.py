@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+Converter GUI Dialogs
+---------------------
+Secondary windows of the converter GUI, imported on first use to keep startup light.
+"""
+
+import tkinter as tk
+from tkinter import ttk, scrolledtext
+from pathlib import Path
+
+from bidirectional_converter import DetailLevel
+
+
+class OptionsDialog:
+    """Options dialog for conversion settings"""
+    
+    def __init__(self, parent, converter):
+        self.parent = parent
+        self.converter = converter
+        self.dialog = None
+        
+    def show(self):
+        """Show the options dialog"""
+        self.dialog = tk.Toplevel(self.parent)
+        self.dialog.title("Conversion Options")
+        self.dialog.geometry("500x400")
+        self.dialog.transient(self.parent)
+        
+        # Create notebook for different option categories
+        notebook = ttk.Notebook(self.dialog)
+        notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Text-to-Code options
+        t2c_frame = ttk.Frame(notebook)
+        notebook.add(t2c_frame, text="Text to Code")
+        self._create_text_to_code_options(t2c_frame)
+        
+        # Code-to-Text options
+        c2t_frame = ttk.Frame(notebook)
+        notebook.add(c2t_frame, text="Code to Text")
+        self._create_code_to_text_options(c2t_frame)
+        
+        # General options
+        general_frame = ttk.Frame(notebook)
+        notebook.add(general_frame, text="General")
+        self._create_general_options(general_frame)
+        
+        # Buttons
+        button_frame = ttk.Frame(self.dialog)
+        button_frame.pack(fill=tk.X, padx=10, pady=10)
+        
+        ttk.Button(button_frame, text="Apply", command=self._apply_options).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(button_frame, text="Cancel", command=self.dialog.destroy).pack(side=tk.RIGHT)
+        
+    def _create_text_to_code_options(self, parent):
+        """Create text-to-code options"""
+        # Include comments
+        self.include_comments_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(
+            parent, text="Include comments",
+            variable=self.include_comments_var
+        ).pack(anchor=tk.W, padx=10, pady=5)
+        
+        # Include docstrings
+        self.include_docstrings_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(
+            parent, text="Include docstrings",
+            variable=self.include_docstrings_var
+        ).pack(anchor=tk.W, padx=10, pady=5)
+        
+        # Use type hints
+        self.use_type_hints_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(
+            parent, text="Use type hints (Python)",
+            variable=self.use_type_hints_var
+        ).pack(anchor=tk.W, padx=10, pady=5)
+        
+        # Follow conventions
+        self.follow_conventions_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(
+            parent, text="Follow language conventions",
+            variable=self.follow_conventions_var
+        ).pack(anchor=tk.W, padx=10, pady=5)
+        
+    def _create_code_to_text_options(self, parent):
+        """Create code-to-text options"""
+        # Detail level
+        detail_frame = ttk.LabelFrame(parent, text="Detail Level")
+        detail_frame.pack(fill=tk.X, padx=10, pady=10)
+        
+        self.detail_level_var = tk.StringVar(value="standard")
+        ttk.Radiobutton(
+            detail_frame, text="Summary",
+            variable=self.detail_level_var, value="summary"
+        ).pack(anchor=tk.W, padx=5, pady=2)
+        ttk.Radiobutton(
+            detail_frame, text="Standard",
+            variable=self.detail_level_var, value="standard"
+        ).pack(anchor=tk.W, padx=5, pady=2)
+        ttk.Radiobutton(
+            detail_frame, text="Detailed",
+            variable=self.detail_level_var, value="detailed"
+        ).pack(anchor=tk.W, padx=5, pady=2)
+        
+        # Include examples
+        self.include_examples_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(
+            parent, text="Include usage examples",
+            variable=self.include_examples_var
+        ).pack(anchor=tk.W, padx=10, pady=5)
+        
+        # Technical level
+        tech_frame = ttk.LabelFrame(parent, text="Technical Level")
+        tech_frame.pack(fill=tk.X, padx=10, pady=10)
+        
+        self.technical_level_var = tk.StringVar(value="intermediate")
+        ttk.Radiobutton(
+            tech_frame, text="Beginner",
+            variable=self.technical_level_var, value="beginner"
+        ).pack(anchor=tk.W, padx=5, pady=2)
+        ttk.Radiobutton(
+            tech_frame, text="Intermediate",
+            variable=self.technical_level_var, value="intermediate"
+        ).pack(anchor=tk.W, padx=5, pady=2)
+        ttk.Radiobutton(
+            tech_frame, text="Advanced",
+            variable=self.technical_level_var, value="advanced"
+        ).pack(anchor=tk.W, padx=5, pady=2)
+        
+    def _create_general_options(self, parent):
+        """Create general options"""
+        # Temperature
+        temp_frame = ttk.LabelFrame(parent, text="Temperature (Creativity)")
+        temp_frame.pack(fill=tk.X, padx=10, pady=10)
+        
+        self.temperature_var = tk.DoubleVar(value=0.3)
+        temp_scale = ttk.Scale(
+            temp_frame, from_=0.0, to=1.0,
+            variable=self.temperature_var, orient=tk.HORIZONTAL
+        )
+        temp_scale.pack(fill=tk.X, padx=10, pady=5)
+        
+        temp_label = ttk.Label(temp_frame, text="0.3")
+        temp_label.pack()
+        
+        def update_temp_label(value):
+            temp_label.config(text=f"{float(value):.1f}")
+        
+        temp_scale.config(command=update_temp_label)
+        
+        # Max tokens
+        tokens_frame = ttk.LabelFrame(parent, text="Max Tokens")
+        tokens_frame.pack(fill=tk.X, padx=10, pady=10)
+        
+        self.max_tokens_var = tk.IntVar(value=4096)
+        ttk.Spinbox(
+            tokens_frame, from_=100, to=8192, increment=100,
+            textvariable=self.max_tokens_var, width=10
+        ).pack(padx=10, pady=5)
+        
+    def _apply_options(self):
+        """Apply the selected options"""
+        if self.converter:
+            # Update converter configuration
+            self.converter.config.include_comments = self.include_comments_var.get()
+            self.converter.config.include_docstrings = self.include_docstrings_var.get()
+            self.converter.config.use_type_hints = self.use_type_hints_var.get()
+            self.converter.config.follow_conventions = self.follow_conventions_var.get()
+            self.converter.config.detail_level = DetailLevel(self.detail_level_var.get())
+            self.converter.config.include_examples = self.include_examples_var.get()
+            self.converter.config.technical_level = self.technical_level_var.get()
+            self.converter.config.temperature = self.temperature_var.get()
+            self.converter.config.max_tokens = self.max_tokens_var.get()
+        
+        self.dialog.destroy()
+
+
+class APISettingsDialog:
+    """API settings dialog"""
+    
+    def __init__(self, parent, config, config_path: Path):
+        self.parent = parent
+        self.config = config
+        self.config_path = config_path
+        self.dialog = None
+        self.result = False
+        
+    def show(self):
+        """Show the API settings dialog and return True if settings were changed"""
+        self.dialog = tk.Toplevel(self.parent)
+        self.dialog.title("API Settings")
+        self.dialog.geometry("500x300")
+        self.dialog.transient(self.parent)
+        
+        # Model selection
+        model_frame = ttk.LabelFrame(self.dialog, text="Model")
+        model_frame.pack(fill=tk.X, padx=10, pady=10)
+        
+        self.model_var = tk.StringVar(value=self.config['API']['model'])
+        model_combo = ttk.Combobox(
+            model_frame, textvariable=self.model_var,
+            values=["claude-3-opus-20240229", "claude-3-sonnet-20240229", "claude-3-haiku-20240307"],
+            state="readonly", width=30
+        )
+        model_combo.pack(padx=10, pady=5)
+        
+        # Temperature
+        temp_frame = ttk.LabelFrame(self.dialog, text="Default Temperature")
+        temp_frame.pack(fill=tk.X, padx=10, pady=10)
+        
+        self.temp_var = tk.StringVar(value=self.config['API']['temperature'])
+        ttk.Entry(temp_frame, textvariable=self.temp_var, width=10).pack(padx=10, pady=5)
+        
+        # Max tokens
+        tokens_frame = ttk.LabelFrame(self.dialog, text="Default Max Tokens")
+        tokens_frame.pack(fill=tk.X, padx=10, pady=10)
+        
+        self.tokens_var = tk.StringVar(value=self.config['API']['max_tokens'])
+        ttk.Entry(tokens_frame, textvariable=self.tokens_var, width=10).pack(padx=10, pady=5)
+        
+        # Cache settings
+        cache_frame = ttk.LabelFrame(self.dialog, text="Cache")
+        cache_frame.pack(fill=tk.X, padx=10, pady=10)
+        
+        self.cache_enabled_var = tk.BooleanVar(value=self.config['Cache'].getboolean('enabled'))
+        ttk.Checkbutton(
+            cache_frame, text="Enable cache",
+            variable=self.cache_enabled_var
+        ).pack(anchor=tk.W, padx=10, pady=5)
+        
+        # Buttons
+        button_frame = ttk.Frame(self.dialog)
+        button_frame.pack(fill=tk.X, padx=10, pady=10)
+        
+        ttk.Button(button_frame, text="Save", command=self._save_settings).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(button_frame, text="Cancel", command=self.dialog.destroy).pack(side=tk.RIGHT)
+        
+        # Wait for dialog to close
+        self.dialog.wait_window()
+        return self.result
+        
+    def _save_settings(self):
+        """Save the API settings"""
+        self.config['API']['model'] = self.model_var.get()
+        self.config['API']['temperature'] = self.temp_var.get()
+        self.config['API']['max_tokens'] = self.tokens_var.get()
+        self.config['Cache']['enabled'] = str(self.cache_enabled_var.get())
+        
+        # Save to file
+        with open(self.config_path, 'w') as f:
+            self.config.write(f)
+        
+        self.result = True
+        self.dialog.destroy()
+
+
+class ExamplesWindow:
+    """Examples window showing various conversion examples"""
+    
+    def __init__(self, parent):
+        self.parent = parent
+        
+    def show(self):
+        """Show the examples window"""
+        window = tk.Toplevel(self.parent)
+        window.title("Conversion Examples")
+        window.geometry("800x600")
+        window.transient(self.parent)
+        
+        # Create notebook for different example categories
+        notebook = ttk.Notebook(window)
+        notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Add example tabs
+        self._add_text_to_code_examples(notebook)
+        self._add_code_to_text_examples(notebook)
+        
+    def _add_text_to_code_examples(self, notebook):
+        """Add text-to-code examples tab"""
+        frame = ttk.Frame(notebook)
+        notebook.add(frame, text="Text → Code")
+        
+        # Example content would go here
+        text = scrolledtext.ScrolledText(frame, wrap=tk.WORD)
+        text.pack(fill=tk.BOTH, expand=True)
+        
+        examples = """
+Text-to-Code Examples
+====================
+
+Example 1: Python Function
+--------------------------
+Input: "Create a function that calculates the factorial of a number using recursion"
+
+Output:
+def factorial(n):
+    '''Calculate the factorial of a number using recursion.
+    
+    Args:
+        n (int): The number to calculate factorial for
+        
+    Returns:
+        int: The factorial of n
+        
+    Raises:
+        ValueError: If n is negative
+    '''
+    if n < 0:
+        raise ValueError("Factorial is not defined for negative numbers")
+    elif n == 0 or n == 1:
+        return 1
+    else:
+        return n * factorial(n - 1)
+
+Example 2: JavaScript Class
+---------------------------
+Input: "Create a JavaScript class for a shopping cart with methods to add items, remove items, and calculate total"
+
+Output:
+class ShoppingCart {
+    constructor() {
+        this.items = [];
+    }
+    
+    addItem(item, quantity = 1, price) {
+        const existingItem = this.items.find(i => i.item === item);
+        if (existingItem) {
+            existingItem.quantity += quantity;
+        } else {
+            this.items.push({ item, quantity, price });
+        }
+    }
+    
+    removeItem(item) {
+        this.items = this.items.filter(i => i.item !== item);
+    }
+    
+    calculateTotal() {
+        return this.items.reduce((total, item) => {
+            return total + (item.quantity * item.price);
+        }, 0);
+    }
+}
+"""
+        text.insert("1.0", examples)
+        text.config(state=tk.DISABLED)
+    
+    def _add_code_to_text_examples(self, notebook):
+        """Add code-to-text examples tab"""
+        frame = ttk.Frame(notebook)
+        notebook.add(frame, text="Code → Text")
+        
+        text = scrolledtext.ScrolledText(frame, wrap=tk.WORD)
+        text.pack(fill=tk.BOTH, expand=True)
+        
+        examples = """
+Code-to-Text Examples
+====================
+
+Example 1: Algorithm Explanation
+--------------------------------
+Input:
+def binary_search(arr, target):
+    left, right = 0, len(arr) - 1
+    
+    while left <= right:
+        mid = (left + right) // 2
+        if arr[mid] == target:
+            return mid
+        elif arr[mid] < target:
+            left = mid + 1
+        else:
+            right = mid - 1
+    
+    return -1
+
+Output:
+This function implements the binary search algorithm to find a target value in a sorted array.
+
+The algorithm works by:
+1. Initializing two pointers: 'left' at the start (0) and 'right' at the end of the array
+2. Repeatedly dividing the search space in half by calculating the middle index
+3. Comparing the middle element with the target value
+4. If they match, returning the index
+5. If the middle element is less than the target, searching the right half
+6. If the middle element is greater than the target, searching the left half
+7. Continuing until the element is found or the search space is empty
+
+Time Complexity: O(log n)
+Space Complexity: O(1)
+
+Example usage:
+numbers = [1, 3, 5, 7, 9, 11, 13]
+index = binary_search(numbers, 7)  # Returns 3
+"""
+        text.insert("1.0", examples)
+        text.config(state=tk.DISABLED)
@@ -8,16 +8,47 @@ context menus, and dynamic prompt generation.
 
 import tkinter as tk
 from tkinter import ttk, font as tkfont
+import io
 import re
-from typing import Dict, List, Tuple, Optional, Set
-from dataclasses import dataclass
+import sys
+import bisect
+from functools import lru_cache
+from itertools import count
+from collections import defaultdict
+from typing import Dict, List, Tuple, Optional, Set, Iterable
+from dataclasses import dataclass, fields, replace
 import json
-from datetime import datetime
 
+# Optional RE2 engine for markup scans: linear time even on unterminated delimiters
+try:
+    import re2 as _re
+except ImportError:
+    _re = re
 
-@dataclass
+# Optional fast JSON codec for markup import/export
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Idle time (ms) after the last keystroke before highlighting is refreshed
+_REFRESH_DELAY_MS = 150
+
+# Tcl lambda applying a flat list of (start, end, text) replacements to a Text widget
+_BATCH_REPLACE_TCL = "{w edits} {foreach {s e t} $edits {$w replace $s $e $t}}"
+
+# Context menu entries that only apply when text is selected
+_SELECTION_MENU_LABELS = ("Apply Markup", "Apply to All Occurrences", "Remove Markup", "Remove All Markup")
+
+# Whole words, as indexed for quick searching
+_WORD_RE = re.compile(r'\b\w+\b')
+
+
+@dataclass(slots=True, frozen=True)
 class MarkupDefinition:
-    """Defines a custom markup pattern"""
+    """Defines a custom markup pattern; immutable, so replace rather than edit"""
     name: str
     start_delimiter: str
     end_delimiter: str
@@ -27,6 +58,15 @@ class MarkupDefinition:
     font_style: Optional[str] = None  # bold, italic, underline
     example: Optional[str] = None
     
+    def __post_init__(self):
+        # Delimiters are short and compared/hashed constantly; share one copy
+        object.__setattr__(self, "start_delimiter", sys.intern(self.start_delimiter))
+        object.__setattr__(self, "end_delimiter", sys.intern(self.end_delimiter))
+    
+
+# MarkupDefinition is slotted and flat, so export reads these fields directly
+_MARKUP_FIELDS = tuple(f.name for f in fields(MarkupDefinition))
+
 
 @dataclass
 class TextSelection:
@@ -36,89 +76,226 @@ class TextSelection:
     text: str
     
 
+def _compile_markup(start: str, end: str) -> re.Pattern:
+    """Compile the pattern for one markup; group 1 is the inner text"""
+    return _re.compile(f"{_re.escape(start)}(.*?){_re.escape(end)}")
+
+
+def _build_combined(names: Tuple[str, ...], starts: Tuple[str, ...],
+                    ends: Tuple[str, ...]) -> Tuple[re.Pattern, Dict[str, str]]:
+    """Compile one alternation over all markups, plus its group -> markup name map"""
+    # Markup names are free text, so groups get positional names
+    alternatives = []
+    group_names = {}
+    # Alternation is leftmost-first, so try longer start delimiters first:
+    # "[[x]]" must not be claimed by a "[" markup. sorted() is stable, so
+    # equal lengths keep definition order.
+    markups = sorted(zip(names, starts, ends), key=lambda m: -len(m[1]))
+    for i, (name, start, end) in enumerate(markups):
+        group = f"m{i}"
+        group_names[group] = name
+        alternatives.append(
+            f"(?P<{group}>{_re.escape(start)}(?P<{group}_i>.*?){_re.escape(end)})"
+        )
+    if not alternatives:
+        # Never matches; RE2 has no lookaround, so use the stdlib engine
+        return re.compile("(?!)"), group_names
+    return _re.compile("|".join(alternatives)), group_names
+
+
+# Built-in markups, shared by every MarkupManager along with their compiled patterns
+_DEFAULT_MARKUPS = (
+    MarkupDefinition(
+        name="emphasis",
+        start_delimiter="///",
+        end_delimiter="\\\\\\",
+        description="Emphasizes important text",
+        color="#D32F2F",
+        font_style="bold",
+        example="///IMPORTANT\\\\\\"
+    ),
+    MarkupDefinition(
+        name="context",
+        start_delimiter="<<<",
+        end_delimiter=">>>",
+        description="Provides contextual information",
+        color="#1976D2",
+        background="#E3F2FD",
+        example="<<<context: technical>>>>"
+    ),
+    MarkupDefinition(
+        name="instruction",
+        start_delimiter="{{",
+        end_delimiter="}}",
+        description="Special instruction for AI",
+        color="#388E3C",
+        font_style="italic",
+        example="{{treat as code}}"
+    ),
+    MarkupDefinition(
+        name="variable",
+        start_delimiter="[[",
+        end_delimiter="]]",
+        description="Variable placeholder",
+        color="#7B1FA2",
+        background="#F3E5F5",
+        example="[[user_name]]"
+    ),
+    MarkupDefinition(
+        name="warning",
+        start_delimiter="!!!",
+        end_delimiter="!!!",
+        description="Warning or caution",
+        color="#F57C00",
+        font_style="bold",
+        example="!!!CAUTION!!!"
+    )
+)
+_DEFAULT_COMPILED = {
+    m.name: _compile_markup(m.start_delimiter, m.end_delimiter) for m in _DEFAULT_MARKUPS
+}
+_DEFAULT_NAMES = tuple(m.name for m in _DEFAULT_MARKUPS)
+_DEFAULT_COMBINED, _DEFAULT_GROUP_NAMES = _build_combined(
+    _DEFAULT_NAMES,
+    tuple(m.start_delimiter for m in _DEFAULT_MARKUPS),
+    tuple(m.end_delimiter for m in _DEFAULT_MARKUPS)
+)
+
+
 class MarkupManager:
     """Manages custom markup definitions and applications"""
     
     def __init__(self):
         self.markups: Dict[str, MarkupDefinition] = {}
+        # Compiled delimiter pattern per markup, kept in step with self.markups
+        self._compiled: Dict[str, re.Pattern] = {}
+        # Single alternation over all markups, rebuilt lazily after changes
+        self._combined: Optional[re.Pattern] = None
+        self._group_names: Dict[str, str] = {}
+        # Bumped on every change to the markup set; get_markup_key is cached against it
+        self._version = 0
+        self._key_cache: Optional[str] = None
+        # (name, definition) pairs in insertion order, for UI listings
+        self._ordered: List[Tuple[str, MarkupDefinition]] = []
+        # Parallel tuples of the fields the scan paths need
+        self._names: Tuple[str, ...] = ()
+        self._starts: Tuple[str, ...] = ()
+        self._ends: Tuple[str, ...] = ()
         self._load_default_markups()
         
     def _load_default_markups(self):
         """Load default markup definitions"""
-        defaults = [
-            MarkupDefinition(
-                name="emphasis",
-                start_delimiter="///",
-                end_delimiter="\\\\\\",
-                description="Emphasizes important text",
-                color="#D32F2F",
-                font_style="bold",
-                example="///IMPORTANT\\\\\\"
-            ),
-            MarkupDefinition(
-                name="context",
-                start_delimiter="<<<",
-                end_delimiter=">>>",
-                description="Provides contextual information",
-                color="#1976D2",
-                background="#E3F2FD",
-                example="<<<context: technical>>>>"
-            ),
-            MarkupDefinition(
-                name="instruction",
-                start_delimiter="{{",
-                end_delimiter="}}",
-                description="Special instruction for AI",
-                color="#388E3C",
-                font_style="italic",
-                example="{{treat as code}}"
-            ),
-            MarkupDefinition(
-                name="variable",
-                start_delimiter="[[",
-                end_delimiter="]]",
-                description="Variable placeholder",
-                color="#7B1FA2",
-                background="#F3E5F5",
-                example="[[user_name]]"
-            ),
-            MarkupDefinition(
-                name="warning",
-                start_delimiter="!!!",
-                end_delimiter="!!!",
-                description="Warning or caution",
-                color="#F57C00",
-                font_style="bold",
-                example="!!!CAUTION!!!"
-            )
-        ]
-        
-        for markup in defaults:
+        # Definitions and their patterns are shared, precompiled module constants
+        for markup in _DEFAULT_MARKUPS:
             self.markups[markup.name] = markup
+        self._compiled.update(_DEFAULT_COMPILED)
+        self._invalidate()
+        
+        if self._names == _DEFAULT_NAMES:
+            self._combined = _DEFAULT_COMBINED
+            self._group_names = dict(_DEFAULT_GROUP_NAMES)
+    
+    @staticmethod
+    def _check_delimiters(markup: MarkupDefinition):
+        """Reject definitions whose pattern could match the empty string"""
+        if not markup.start_delimiter or not markup.end_delimiter:
+            raise ValueError(f"Markup '{markup.name}' needs both a start and an end delimiter")
     
     def add_markup(self, markup: MarkupDefinition):
         """Add a new markup definition"""
+        self._check_delimiters(markup)
         self.markups[markup.name] = markup
+        self._compiled[markup.name] = _compile_markup(markup.start_delimiter, markup.end_delimiter)
+        self._invalidate()
+    
+    def add_markups_bulk(self, markups: Iterable[MarkupDefinition]):
+        """Add many markup definitions, rebuilding derived state only once"""
+        # Validate everything first so a bad definition adds nothing
+        markups = list(markups)
+        for markup in markups:
+            self._check_delimiters(markup)
+        for markup in markups:
+            self.markups[markup.name] = markup
+            self._compiled[markup.name] = _compile_markup(markup.start_delimiter, markup.end_delimiter)
+        self._invalidate()
     
     def remove_markup(self, name: str):
         """Remove a markup definition"""
         if name in self.markups:
             del self.markups[name]
+            del self._compiled[name]
+            self._invalidate()
+    
+    def reset_to_defaults(self):
+        """Discard all markup definitions and reload the defaults"""
+        self.markups.clear()
+        self._compiled.clear()
+        self._invalidate()
+        self._load_default_markups()
+    
+    def _invalidate(self):
+        """Drop state derived from the markup set"""
+        self._combined = None
+        self._key_cache = None
+        self._ordered = list(self.markups.items())
+        self._rebuild_soa()
+        self._version += 1
+    
+    def _rebuild_soa(self):
+        """Refresh the parallel name/start/end tuples from self.markups"""
+        self._names = tuple(self.markups)
+        self._starts = tuple(m.start_delimiter for m in self.markups.values())
+        self._ends = tuple(m.end_delimiter for m in self.markups.values())
+    
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """Markup names in insertion order"""
+        return self._names
+    
+    @property
+    def patterns(self) -> Dict[str, re.Pattern]:
+        """Compiled pattern per markup name; group 1 is the inner text"""
+        return self._compiled
+    
+    @property
+    def ordered(self) -> List[Tuple[str, MarkupDefinition]]:
+        """Markup (name, definition) pairs in insertion order"""
+        return self._ordered
+    
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever the markup set changes"""
+        return self._version
+    
+    @property
+    def combined_pattern(self) -> re.Pattern:
+        """One pattern matching any markup; see _group_names for the group mapping"""
+        if self._combined is None:
+            self._combined, self._group_names = _build_combined(
+                self._names, self._starts, self._ends
+            )
+        return self._combined
     
     def get_markup_key(self) -> str:
         """Generate a markup key/legend for prompts"""
-        key_lines = ["MARKUP KEY:"]
-        key_lines.append("=" * 40)
+        if self._key_cache is not None:
+            return self._key_cache
         
-        for name, markup in self.markups.items():
-            key_lines.append(f"\n{markup.name.upper()}:")
-            key_lines.append(f"  Format: {markup.start_delimiter}text{markup.end_delimiter}")
-            key_lines.append(f"  Purpose: {markup.description}")
+        buf = io.StringIO()
+        buf.write("MARKUP KEY:\n" + "=" * 40)
+        
+        for markup in self.markups.values():
+            buf.write(
+                f"\n\n{markup.name.upper()}:"
+                f"\n  Format: {markup.start_delimiter}text{markup.end_delimiter}"
+                f"\n  Purpose: {markup.description}"
+            )
             if markup.example:
-                key_lines.append(f"  Example: {markup.example}")
+                buf.write(f"\n  Example: {markup.example}")
         
-        key_lines.append("\n" + "=" * 40)
-        return "\n".join(key_lines)
+        buf.write("\n\n" + "=" * 40)
+        self._key_cache = buf.getvalue()
+        return self._key_cache
     
     def apply_markup(self, text: str, markup_name: str) -> str:
         """Apply markup to text"""
@@ -128,26 +305,32 @@ class MarkupManager:
         markup = self.markups[markup_name]
         return f"{markup.start_delimiter}{text}{markup.end_delimiter}"
     
+    def strip_markup(self, text: str) -> str:
+        """Replace every markup instance in text with its inner text"""
+        pattern = self.combined_pattern
+        
+        def extract_inner(match):
+            return match.group(f"{match.lastgroup}_i")
+        
+        return pattern.sub(extract_inner, text)
+    
     def find_all_markup(self, text: str) -> List[Tuple[str, int, int, str]]:
         """Find all markup instances in text"""
+        pattern = self.combined_pattern
+        names = self._group_names
         results = []
         
-        for name, markup in self.markups.items():
-            # Escape special regex characters
-            start = re.escape(markup.start_delimiter)
-            end = re.escape(markup.end_delimiter)
-            
-            # Find all matches
-            pattern = f"{start}(.*?){end}"
-            for match in re.finditer(pattern, text):
-                results.append((
-                    name,
-                    match.start(),
-                    match.end(),
-                    match.group(1)
-                ))
-        
-        return sorted(results, key=lambda x: x[1])
+        # One scan of the text; matches arrive in position order
+        for match in pattern.finditer(text):
+            group = match.lastgroup
+            results.append((
+                names[group],
+                match.start(),
+                match.end(),
+                match.group(f"{group}_i")
+            ))
+        
+        return results
 
 
 class EnhancedTextEditor(tk.Text):
@@ -158,9 +341,26 @@ class EnhancedTextEditor(tk.Text):
         
         self.markup_manager = markup_manager
         self.context_menu = None
+        # Markup set version the context submenus were built for
+        self._menu_version: Optional[int] = None
+        self._menu_selection_text = ""
+        
+        # Bold/italic variants of the editor font, shared by all markup tags
+        self._bold_font = tkfont.Font(root=self)
+        self._italic_font = tkfont.Font(root=self)
+        self._rebuild_fonts()
+        
         self._setup_tags()
         self._setup_bindings()
-        self._word_occurrences: Dict[str, List[Tuple[str, str]]] = {}
+        # Word -> (start, end) character offsets; see get_word_occurrences
+        self._word_occurrences: Dict[str, List[Tuple[int, int]]] = {}
+        self._word_line_starts: List[int] = [0]
+        # Pending debounced refresh scheduled by _on_text_change
+        self._pending_after: Optional[str] = None
+        # (first, last) line touched since the last refresh
+        self._dirty_lines: Optional[Tuple[int, int]] = None
+        # Set by <<Modified>>; refreshes without it are skipped
+        self._modified = False
         
     def _setup_tags(self):
         """Configure text tags for markup display"""
@@ -170,76 +370,96 @@ class EnhancedTextEditor(tk.Text):
             if markup.background:
                 tag_config["background"] = markup.background
                 
-            if markup.font_style:
-                current_font = tkfont.Font(font=self['font'])
-                if markup.font_style == "bold":
-                    tag_config["font"] = current_font.copy()
-                    tag_config["font"].configure(weight="bold")
-                elif markup.font_style == "italic":
-                    tag_config["font"] = current_font.copy()
-                    tag_config["font"].configure(slant="italic")
-                elif markup.font_style == "underline":
-                    tag_config["underline"] = True
+            if markup.font_style == "bold":
+                tag_config["font"] = self._bold_font
+            elif markup.font_style == "italic":
+                tag_config["font"] = self._italic_font
+            elif markup.font_style == "underline":
+                tag_config["underline"] = True
             
             self.tag_configure(f"markup_{name}", **tag_config)
     
+    def _rebuild_fonts(self, event=None):
+        """Derive the shared markup fonts from the editor's current font"""
+        base = tkfont.Font(root=self, font=self['font']).actual()
+        # Named fonts update every tag that uses them in place
+        self._bold_font.configure(**{**base, "weight": "bold"})
+        self._italic_font.configure(**{**base, "slant": "italic"})
+    
     def _setup_bindings(self):
         """Set up event bindings"""
         self.bind("<Button-3>", self._show_context_menu)  # Right-click
         self.bind("<Control-m>", self._quick_markup)  # Ctrl+M for quick markup
+        self.bind("<KeyPress>", self._mark_dirty)  # Runs before the edit is applied
         self.bind("<KeyRelease>", self._on_text_change)
+        self.bind("<<Modified>>", self._on_modified)
         self.bind("<<Selection>>", self._on_selection_change)
+        self.bind("<<ThemeChanged>>", self._rebuild_fonts)
     
-    def _show_context_menu(self, event):
-        """Show context menu on right-click"""
-        # Destroy existing menu if any
-        if self.context_menu:
-            self.context_menu.destroy()
-        
-        # Create new context menu
+    def _build_context_menu(self):
+        """Create the context menu once; markup entries are filled by _sync_markup_menus"""
         self.context_menu = tk.Menu(self, tearoff=0)
+        self._markup_menu = tk.Menu(self.context_menu, tearoff=0)
+        self._apply_all_menu = tk.Menu(self.context_menu, tearoff=0)
+        
+        # Selection-dependent options
+        self.context_menu.add_cascade(label="Apply Markup", menu=self._markup_menu)
+        self.context_menu.add_separator()
+        self.context_menu.add_cascade(label="Apply to All Occurrences", menu=self._apply_all_menu)
+        self.context_menu.add_separator()
+        self.context_menu.add_command(
+            label="Remove Markup",
+            command=self._remove_markup_from_selection
+        )
+        self.context_menu.add_command(
+            label="Remove All Markup",
+            command=self._remove_all_markup
+        )
         
-        # Get current selection
+        # Standard edit options
+        self.context_menu.add_separator()
+        self.context_menu.add_command(label="Cut", command=self._cut)
+        self.context_menu.add_command(label="Copy", command=self._copy)
+        self.context_menu.add_command(label="Paste", command=self._paste)
+    
+    def _sync_markup_menus(self):
+        """Rebuild the markup submenus if the markup set changed since the last build"""
+        if self._menu_version == self.markup_manager.version:
+            return
+        
+        self._markup_menu.delete(0, tk.END)
+        self._apply_all_menu.delete(0, tk.END)
+        for name, markup in self.markup_manager.markups.items():
+            self._markup_menu.add_command(
+                label=f"{markup.name} ({markup.start_delimiter}...{markup.end_delimiter})",
+                command=lambda n=name: self._apply_markup_to_selection(n)
+            )
+            # Label is filled in with the selected text when the menu is posted
+            self._apply_all_menu.add_command(
+                command=lambda n=name: self._apply_markup_to_all(n, self._menu_selection_text)
+            )
+        self._menu_version = self.markup_manager.version
+    
+    def _show_context_menu(self, event):
+        """Show context menu on right-click"""
         try:
+            if self.context_menu is None:
+                self._build_context_menu()
+            self._sync_markup_menus()
+            
+            # Get current selection
             selection = self.get_selection()
+            state = tk.NORMAL if selection else tk.DISABLED
+            for label in _SELECTION_MENU_LABELS:
+                self.context_menu.entryconfigure(label, state=state)
+            
             if selection:
                 selected_text = selection.text
-                
-                # Add markup options
-                markup_menu = tk.Menu(self.context_menu, tearoff=0)
-                for name, markup in self.markup_manager.markups.items():
-                    markup_menu.add_command(
-                        label=f"{markup.name} ({markup.start_delimiter}...{markup.end_delimiter})",
-                        command=lambda n=name: self._apply_markup_to_selection(n)
+                self._menu_selection_text = selected_text
+                for i, markup in enumerate(self.markup_manager.markups.values()):
+                    self._apply_all_menu.entryconfigure(
+                        i, label=f"{markup.name} to all '{selected_text}'"
                     )
-                self.context_menu.add_cascade(label="Apply Markup", menu=markup_menu)
-                
-                # Add "Apply to All" option
-                self.context_menu.add_separator()
-                apply_all_menu = tk.Menu(self.context_menu, tearoff=0)
-                for name, markup in self.markup_manager.markups.items():
-                    apply_all_menu.add_command(
-                        label=f"{markup.name} to all '{selected_text}'",
-                        command=lambda n=name, t=selected_text: self._apply_markup_to_all(n, t)
-                    )
-                self.context_menu.add_cascade(label="Apply to All Occurrences", menu=apply_all_menu)
-                
-                # Add remove markup option
-                self.context_menu.add_separator()
-                self.context_menu.add_command(
-                    label="Remove Markup",
-                    command=self._remove_markup_from_selection
-                )
-                self.context_menu.add_command(
-                    label="Remove All Markup",
-                    command=self._remove_all_markup
-                )
-            
-            # Standard edit options
-            self.context_menu.add_separator()
-            self.context_menu.add_command(label="Cut", command=self._cut)
-            self.context_menu.add_command(label="Copy", command=self._copy)
-            self.context_menu.add_command(label="Paste", command=self._paste)
             
             # Show menu
             self.context_menu.post(event.x_root, event.y_root)
@@ -283,14 +503,7 @@ class EnhancedTextEditor(tk.Text):
         content = self.get("1.0", tk.END)
         
         # Find all occurrences
-        occurrences = []
-        start_pos = 0
-        while True:
-            pos = content.find(target_text, start_pos)
-            if pos == -1:
-                break
-            occurrences.append(pos)
-            start_pos = pos + 1
+        occurrences = [m.start() for m in _re.finditer(_re.escape(target_text), content)]
         
         # Apply markup to each occurrence (in reverse order to maintain positions)
         markup = self.markup_manager.markups.get(markup_name)
@@ -298,22 +511,20 @@ class EnhancedTextEditor(tk.Text):
             return
         
         marked_text = self.markup_manager.apply_markup(target_text, markup_name)
-        offset = 0
+        line_starts = self._compute_linecol_index(content)
         
-        for pos in occurrences:
-            # Calculate text widget index
-            start_index = self.index(f"1.0 + {pos + offset} chars")
-            end_index = self.index(f"1.0 + {pos + offset + len(target_text)} chars")
-            
-            # Replace text
-            self.delete(start_index, end_index)
-            self.insert(start_index, marked_text)
-            
-            # Update offset for next replacement
-            offset += len(marked_text) - len(target_text)
+        # Editing right to left leaves the offsets of earlier occurrences valid
+        edits = []
+        for pos in reversed(occurrences):
+            edits.append(self._offset_to_index(line_starts, pos))
+            edits.append(self._offset_to_index(line_starts, pos + len(target_text)))
+            edits.append(marked_text)
         
-        # Update highlighting
-        self._update_markup_highlighting()
+        # Replace every occurrence in a single Tcl call
+        self.tk.call("apply", _BATCH_REPLACE_TCL, self._w, tuple(edits))
+        
+        # Refresh once for the whole batch, from the known new content
+        self._refresh_after_batch(marked_text.join(content.split(target_text)))
     
     def _remove_markup_from_selection(self):
         """Remove markup from selected text"""
@@ -338,72 +549,147 @@ class EnhancedTextEditor(tk.Text):
     
     def _remove_all_markup(self):
         """Remove all markup from the entire document"""
-        content = self.get("1.0", tk.END)
+        content = self.get("1.0", "end-1c")
         
         # Remove all markup patterns
-        for name, markup in self.markup_manager.markups.items():
-            start = re.escape(markup.start_delimiter)
-            end = re.escape(markup.end_delimiter)
-            pattern = f"{start}(.*?){end}"
-            content = re.sub(pattern, r"\1", content)
+        content = self.markup_manager.strip_markup(content)
         
-        # Replace content
-        self.delete("1.0", tk.END)
-        self.insert("1.0", content)
+        # Replace content in one call
+        self.replace("1.0", "end-1c", content)
         
-        # Update highlighting
-        self._update_markup_highlighting()
+        # Refresh once from the content just written
+        self._refresh_after_batch(content)
     
-    def _update_markup_highlighting(self):
-        """Update syntax highlighting for markup"""
-        # Remove all existing markup tags
-        for name in self.markup_manager.markups:
-            self.tag_remove(f"markup_{name}", "1.0", tk.END)
-        
-        # Find and highlight all markup
-        content = self.get("1.0", tk.END)
+    def _update_markup_highlighting(self, start: str = "1.0", end: str = tk.END,
+                                    text: Optional[str] = None):
+        """Update syntax highlighting for markup between start (a line start) and end
+        
+        text, when given, must be the current contents of that range.
+        """
+        # Remove existing markup tags in the range
+        for name in self.markup_manager.names:
+            self.tag_remove(f"markup_{name}", start, end)
+        
+        # Find and highlight markup; markup never spans lines, so whole lines suffice
+        content = self.get(start, end) if text is None else text
         markup_instances = self.markup_manager.find_all_markup(content)
+        line_starts = self._compute_linecol_index(content)
+        first_line = int(self.index(start).split(".")[0])
         
+        ranges = defaultdict(list)
         for name, start_pos, end_pos, inner_text in markup_instances:
-            start_index = self.index(f"1.0 + {start_pos} chars")
-            end_index = self.index(f"1.0 + {end_pos} chars")
-            self.tag_add(f"markup_{name}", start_index, end_index)
+            ranges[name].append(self._offset_to_index(line_starts, start_pos, first_line))
+            ranges[name].append(self._offset_to_index(line_starts, end_pos, first_line))
+        
+        # One Tcl call per tag instead of one per match
+        for name, indices in ranges.items():
+            self.tag_add(f"markup_{name}", *indices)
+    
+    @staticmethod
+    def _compute_linecol_index(text: str) -> List[int]:
+        """Return the offset at which each line of text starts"""
+        line_starts = [0]
+        pos = text.find("\n")
+        while pos != -1:
+            line_starts.append(pos + 1)
+            pos = text.find("\n", pos + 1)
+        return line_starts
+    
+    @staticmethod
+    def _offset_to_index(line_starts: List[int], offset: int, first_line: int = 1) -> str:
+        """Translate a character offset into a Tk "line.col" index without a Tcl call"""
+        line = bisect.bisect_right(line_starts, offset) - 1
+        return f"{line + first_line}.{offset - line_starts[line]}"
+    
+    def _mark_dirty(self, event=None):
+        """Widen the dirty line range to cover the cursor and any selection"""
+        lines = [int(self.index(tk.INSERT).split(".")[0])]
+        if self.tag_ranges(tk.SEL):
+            lines.append(int(self.index(tk.SEL_FIRST).split(".")[0]))
+            lines.append(int(self.index(tk.SEL_LAST).split(".")[0]))
+        
+        low, high = min(lines), max(lines)
+        if self._dirty_lines:
+            low = min(low, self._dirty_lines[0])
+            high = max(high, self._dirty_lines[1])
+        self._dirty_lines = (low, high)
     
     def _on_text_change(self, event=None):
-        """Handle text change events"""
-        self._update_markup_highlighting()
-        self._update_word_index()
+        """Handle text change events; refreshes once typing pauses"""
+        self._mark_dirty()
+        self._schedule_refresh()
+    
+    def _on_modified(self, event=None):
+        """Record that the buffer changed, including edits made outside the keyboard"""
+        # Resetting the flag below raises <<Modified>> again; ignore that echo
+        if not self.edit_modified():
+            return
+        self.edit_modified(False)
+        self._modified = True
+        self._schedule_refresh()
+    
+    def _refresh_after_batch(self, content: str):
+        """Refresh highlighting and the word index once after a programmatic batch edit
+        
+        content must be the whole buffer after the edit.
+        """
+        # The batch's <<Modified>> is still queued; clearing the flag now makes
+        # _on_modified ignore it rather than schedule a second full refresh
+        self.edit_modified(False)
+        self._update_markup_highlighting(text=content)
+        self._update_word_index(content)
+    
+    def _schedule_refresh(self):
+        """(Re)start the debounce timer for _do_refresh"""
+        if self._pending_after:
+            self.after_cancel(self._pending_after)
+        self._pending_after = self.after(_REFRESH_DELAY_MS, self._do_refresh)
+    
+    def _do_refresh(self):
+        """Rebuild highlighting and the word index after an edit"""
+        self._pending_after = None
+        if not self._modified:
+            # Only navigation or selection keys since the last refresh
+            self._dirty_lines = None
+            return
+        self._modified = False
+        
+        # One buffer fetch shared by everything that needs the whole document
+        snapshot = self.get("1.0", tk.END)
+        if self._dirty_lines:
+            # Re-tag only the edited lines plus a little context
+            low, high = self._dirty_lines
+            self._dirty_lines = None
+            self._update_markup_highlighting(
+                f"{low}.0 - 2 lines linestart", f"{high}.0 + 2 lines lineend"
+            )
+        else:
+            self._update_markup_highlighting(text=snapshot)
+        self._update_word_index(snapshot)
     
     def _on_selection_change(self, event=None):
         """Handle selection change events"""
         # Could be used to show selection-specific information
         pass
     
-    def _update_word_index(self):
+    def _update_word_index(self, text: Optional[str] = None):
         """Update index of word occurrences for quick searching"""
-        content = self.get("1.0", tk.END)
+        content = self.get("1.0", tk.END) if text is None else text
+        self._word_line_starts = self._compute_linecol_index(content)
         self._word_occurrences.clear()
         
-        # Simple word tokenization (could be improved)
-        words = re.findall(r'\b\w+\b', content)
-        
-        for word in set(words):
-            occurrences = []
-            start_pos = 0
-            while True:
-                pos = content.find(word, start_pos)
-                if pos == -1:
-                    break
-                # Check if it's a whole word
-                if (pos == 0 or not content[pos-1].isalnum()) and \
-                   (pos + len(word) >= len(content) or not content[pos + len(word)].isalnum()):
-                    start_index = self.index(f"1.0 + {pos} chars")
-                    end_index = self.index(f"1.0 + {pos + len(word)} chars")
-                    occurrences.append((start_index, end_index))
-                start_pos = pos + 1
-            
-            if occurrences:
-                self._word_occurrences[word] = occurrences
+        # Offsets are stored raw and only turned into Tk indices on request
+        occurrences = self._word_occurrences
+        for match in _WORD_RE.finditer(content):
+            occurrences.setdefault(match.group(), []).append(match.span())
+    
+    def get_word_occurrences(self, word: str) -> List[Tuple[str, str]]:
+        """Return (start, end) Tk indices of each whole-word occurrence of word"""
+        line_starts = self._word_line_starts
+        return [
+            (self._offset_to_index(line_starts, start), self._offset_to_index(line_starts, end))
+            for start, end in self._word_occurrences.get(word, ())
+        ]
     
     def _quick_markup(self, event=None):
         """Quick markup shortcut (Ctrl+M)"""
@@ -422,8 +708,8 @@ class EnhancedTextEditor(tk.Text):
         # Markup selection
         ttk.Label(dialog, text="Select markup type:").pack(pady=10)
         
-        markup_var = tk.StringVar(value=list(self.markup_manager.markups.keys())[0])
-        for name, markup in self.markup_manager.markups.items():
+        markup_var = tk.StringVar(value=next(iter(self.markup_manager.markups), ""))
+        for name, markup in self.markup_manager.ordered:
             ttk.Radiobutton(
                 dialog,
                 text=f"{name} ({markup.start_delimiter}...{markup.end_delimiter})",
@@ -469,17 +755,13 @@ class EnhancedTextEditor(tk.Text):
         """Get the full content including markup"""
         return self.get("1.0", tk.END).strip()
     
-    def get_markup_statistics(self) -> Dict[str, int]:
-        """Get statistics about markup usage"""
-        content = self.get("1.0", tk.END)
+    def get_markup_statistics(self, text: Optional[str] = None) -> Dict[str, int]:
+        """Get statistics about markup usage, in text or the current document"""
+        content = self.get("1.0", tk.END) if text is None else text
         stats = {}
         
-        for name, markup in self.markup_manager.markups.items():
-            start = re.escape(markup.start_delimiter)
-            end = re.escape(markup.end_delimiter)
-            pattern = f"{start}(.*?){end}"
-            matches = re.findall(pattern, content)
-            stats[name] = len(matches)
+        for name, pattern in self.markup_manager.patterns.items():
+            stats[name] = len(pattern.findall(content))
         
         return stats
 
@@ -489,6 +771,37 @@ class PromptBuilder:
     
     def __init__(self, markup_manager: MarkupManager):
         self.markup_manager = markup_manager
+        
+        # Static prompt sections, assembled once
+        self._banner = "DOCUMENT WITH CUSTOM MARKUP\n" + "=" * 50 + "\n\n"
+        self._instructions = "\n".join([
+            "",
+            "INSTRUCTIONS:",
+            "The following document contains custom markup as defined above.",
+            "Please interpret the markup according to its purpose when processing the text.",
+            "",
+            "=" * 50,
+            ""
+        ])
+        self._text_to_code_guide = "\n".join([
+            "Pay special attention to:",
+            "- Text marked with EMPHASIS should be implemented as critical features",
+            "- CONTEXT markup provides domain-specific information",
+            "- INSTRUCTION markup contains specific implementation requirements",
+            "- VARIABLE markup indicates placeholders that should become parameters",
+            "- WARNING markup highlights potential issues or edge cases",
+            ""
+        ])
+        self._code_to_text_guide = "\n".join([
+            "When explaining:",
+            "- EMPHASIS markup indicates parts requiring detailed explanation",
+            "- CONTEXT markup provides background information",
+            "- INSTRUCTION markup specifies how to structure the explanation",
+            "- VARIABLE markup shows elements to pay special attention to",
+            "- WARNING markup indicates critical issues to highlight",
+            ""
+        ])
+        self._content_rule = "CONTENT:\n" + "=" * 50 + "\n\n"
     
     def build_prompt_with_context(
         self,
@@ -498,68 +811,43 @@ class PromptBuilder:
         additional_context: Optional[Dict[str, str]] = None
     ) -> str:
         """Build a prompt that includes markup key and context"""
+        buf = io.StringIO()
         
         # Start with markup key
-        prompt_parts = [
-            "DOCUMENT WITH CUSTOM MARKUP",
-            "=" * 50,
-            "",
-            self.markup_manager.get_markup_key(),
-            "",
-            "INSTRUCTIONS:",
-            "The following document contains custom markup as defined above.",
-            "Please interpret the markup according to its purpose when processing the text.",
-            "",
-            "=" * 50,
-            ""
-        ]
+        buf.write(self._banner)
+        buf.write(self.markup_manager.get_markup_key())
+        buf.write("\n")
+        buf.write(self._instructions)
+        buf.write("\n")
         
         # Add mode-specific instructions
         if mode == "text-to-code":
-            prompt_parts.extend([
-                f"Convert the following marked-up text to {language} code.",
-                "Pay special attention to:",
-                "- Text marked with EMPHASIS should be implemented as critical features",
-                "- CONTEXT markup provides domain-specific information",
-                "- INSTRUCTION markup contains specific implementation requirements",
-                "- VARIABLE markup indicates placeholders that should become parameters",
-                "- WARNING markup highlights potential issues or edge cases",
-                ""
-            ])
+            buf.write(f"Convert the following marked-up text to {language} code.\n")
+            buf.write(self._text_to_code_guide)
         else:  # code-to-text
-            prompt_parts.extend([
-                f"Explain the following {language} code, using the markup to guide your explanation.",
-                "When explaining:",
-                "- EMPHASIS markup indicates parts requiring detailed explanation",
-                "- CONTEXT markup provides background information",
-                "- INSTRUCTION markup specifies how to structure the explanation",
-                "- VARIABLE markup shows elements to pay special attention to",
-                "- WARNING markup indicates critical issues to highlight",
-                ""
-            ])
+            buf.write(f"Explain the following {language} code, using the markup to guide your explanation.\n")
+            buf.write(self._code_to_text_guide)
+        buf.write("\n")
         
         # Add additional context if provided
         if additional_context:
-            prompt_parts.extend([
-                "ADDITIONAL CONTEXT:",
-                "=" * 30,
-                ""
-            ])
+            buf.write("ADDITIONAL CONTEXT:\n" + "=" * 30 + "\n\n")
             for key, value in additional_context.items():
-                prompt_parts.append(f"{key}: {value}")
-            prompt_parts.append("")
+                buf.write(f"{key}: {value}\n")
+            buf.write("\n")
         
         # Add the actual content
-        prompt_parts.extend([
-            "CONTENT:",
-            "=" * 50,
-            "",
-            content,
-            "",
-            "=" * 50
-        ])
+        buf.write(self._content_rule)
+        buf.write(content)
+        buf.write("\n\n" + "=" * 50)
         
-        return "\n".join(prompt_parts)
+        return buf.getvalue()
+
+
+@lru_cache(maxsize=2048)
+def _markup_display(markup: MarkupDefinition) -> str:
+    """Listbox row for a markup; definitions are immutable, so an edit is a cache miss"""
+    return f"{markup.name}: {markup.start_delimiter}...{markup.end_delimiter}"
 
 
 class MarkupEditorDialog:
@@ -568,6 +856,9 @@ class MarkupEditorDialog:
     def __init__(self, parent, markup_manager: MarkupManager):
         self.parent = parent
         self.markup_manager = markup_manager
+        # Names and definitions currently shown in markup_listbox, row for row
+        self._listbox_order: List[str] = []
+        self._listbox_shown: Dict[str, MarkupDefinition] = {}
         self.dialog = None
         
     def show(self):
@@ -617,6 +908,8 @@ class MarkupEditorDialog:
         scrollbar.config(command=self.markup_listbox.yview)
         
         # Populate listbox
+        self._listbox_order = []
+        self._listbox_shown = {}
         self._refresh_markup_list()
         
         # Buttons
@@ -771,11 +1064,37 @@ class MarkupEditorDialog:
         ).pack(pady=10)
     
     def _refresh_markup_list(self):
-        """Refresh the markup listbox"""
-        self.markup_listbox.delete(0, tk.END)
-        for name, markup in self.markup_manager.markups.items():
-            display_text = f"{name}: {markup.start_delimiter}...{markup.end_delimiter}"
-            self.markup_listbox.insert(tk.END, display_text)
+        """Bring the markup listbox in line with the manager, touching only changed rows"""
+        markups = self.markup_manager.markups
+        order, shown = self._listbox_order, self._listbox_shown
+        
+        # Drop rows for removed markups, bottom up so indices stay valid
+        for index in range(len(order) - 1, -1, -1):
+            if order[index] not in markups:
+                self.markup_listbox.delete(index)
+                del shown[order.pop(index)]
+        
+        # Surviving rows must still lead the manager's order, else start over
+        if list(markups)[:len(order)] != order:
+            self.markup_listbox.delete(0, tk.END)
+            order.clear()
+            shown.clear()
+        
+        # Rewrite rows whose definition was replaced
+        for index, name in enumerate(order):
+            markup = markups[name]
+            if shown[name] is not markup:
+                self.markup_listbox.delete(index)
+                self.markup_listbox.insert(index, _markup_display(markup))
+                shown[name] = markup
+        
+        # Append rows for new markups
+        new_rows = [(name, markup) for name, markup in markups.items() if name not in shown]
+        if new_rows:
+            self.markup_listbox.insert(tk.END, *(_markup_display(markup) for _, markup in new_rows))
+            for name, markup in new_rows:
+                order.append(name)
+                shown[name] = markup
     
     def _choose_color(self):
         """Open color chooser for text color"""
@@ -839,8 +1158,7 @@ class MarkupEditorDialog:
             return
         
         # Get selected markup name
-        selected_text = self.markup_listbox.get(selection[0])
-        name = selected_text.split(":")[0]
+        name = self._listbox_order[selection[0]]
         
         # TODO: Implement edit dialog
         tk.messagebox.showinfo("Edit", f"Edit functionality for '{name}' would be implemented here.")
@@ -852,8 +1170,7 @@ class MarkupEditorDialog:
             return
         
         # Get selected markup name
-        selected_text = self.markup_listbox.get(selection[0])
-        name = selected_text.split(":")[0]
+        name = self._listbox_order[selection[0]]
         
         if tk.messagebox.askyesno("Confirm Delete", f"Delete markup '{name}'?"):
             self.markup_manager.remove_markup(name)
@@ -866,27 +1183,18 @@ class MarkupEditorDialog:
             return
         
         # Get selected markup
-        selected_text = self.markup_listbox.get(selection[0])
-        name = selected_text.split(":")[0]
+        name = self._listbox_order[selection[0]]
         original = self.markup_manager.markups.get(name)
         
         if original:
             # Create duplicate with new name
-            new_name = f"{name}_copy"
-            counter = 1
-            while new_name in self.markup_manager.markups:
-                new_name = f"{name}_copy{counter}"
-                counter += 1
+            candidates = (f"{name}_copy{i or ''}" for i in count())
+            new_name = next(c for c in candidates if c not in self.markup_manager.markups)
             
-            duplicate = MarkupDefinition(
+            duplicate = replace(
+                original,
                 name=new_name,
-                start_delimiter=original.start_delimiter,
-                end_delimiter=original.end_delimiter,
-                description=f"Copy of {original.description}",
-                color=original.color,
-                background=original.background,
-                font_style=original.font_style,
-                example=original.example
+                description=f"Copy of {original.description}"
             )
             
             self.markup_manager.add_markup(duplicate)
@@ -902,20 +1210,17 @@ class MarkupEditorDialog:
         )
         
         if filename:
-            markups_data = {}
-            for name, markup in self.markup_manager.markups.items():
-                markups_data[name] = {
-                    "start_delimiter": markup.start_delimiter,
-                    "end_delimiter": markup.end_delimiter,
-                    "description": markup.description,
-                    "color": markup.color,
-                    "background": markup.background,
-                    "font_style": markup.font_style,
-                    "example": markup.example
-                }
+            markups_data = {
+                name: {field: getattr(markup, field) for field in _MARKUP_FIELDS}
+                for name, markup in self.markup_manager.markups.items()
+            }
             
-            with open(filename, 'w') as f:
-                json.dump(markups_data, f, indent=2)
+            if ORJSON_AVAILABLE:
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(markups_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filename, 'w') as f:
+                    json.dump(markups_data, f, indent=2)
             
             tk.messagebox.showinfo("Export Complete", f"Markups exported to {filename}")
     
@@ -929,12 +1234,12 @@ class MarkupEditorDialog:
         
         if filename:
             try:
-                with open(filename, 'r') as f:
-                    markups_data = json.load(f)
+                with open(filename, 'rb') as f:
+                    raw = f.read()
+                markups_data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
                 
-                imported_count = 0
-                for name, data in markups_data.items():
-                    markup = MarkupDefinition(
+                markups = [
+                    MarkupDefinition(
                         name=name,
                         start_delimiter=data["start_delimiter"],
                         end_delimiter=data["end_delimiter"],
@@ -944,8 +1249,10 @@ class MarkupEditorDialog:
                         font_style=data.get("font_style"),
                         example=data.get("example")
                     )
-                    self.markup_manager.add_markup(markup)
-                    imported_count += 1
+                    for name, data in markups_data.items()
+                ]
+                self.markup_manager.add_markups_bulk(markups)
+                imported_count = len(markups)
                 
                 self._refresh_markup_list()
                 tk.messagebox.showinfo(
@@ -962,8 +1269,7 @@ class MarkupEditorDialog:
             "Confirm Reset",
             "This will remove all custom markups and restore defaults. Continue?"
         ):
-            self.markup_manager.markups.clear()
-            self.markup_manager._load_default_markups()
+            self.markup_manager.reset_to_defaults()
             self._refresh_markup_list()
 
 
@@ -1005,7 +1311,7 @@ def integrate_enhanced_editor(converter_gui_instance):
     # Override the conversion method to use enhanced prompts
     original_perform_conversion = converter_gui_instance._perform_conversion
     
-    def enhanced_perform_conversion():
+    def enhanced_perform_conversion(event=None):
         """Enhanced conversion that includes markup context"""
         # Get content with markup
         input_content = enhanced_input.get_content_with_markup()
@@ -1014,9 +1320,9 @@ def integrate_enhanced_editor(converter_gui_instance):
         mode = converter_gui_instance.current_mode.value
         language = converter_gui_instance.language_var.get()
         
-        # Get any additional context from UI
+        # Get any additional context from UI; keep it deterministic (no timestamp)
+        # so an unchanged input yields the same prompt and hits the conversion cache
         additional_context = {
-            "timestamp": datetime.now().isoformat(),
             "editor_mode": mode,
             "target_language": language,
             "markup_stats": str(enhanced_input.get_markup_statistics())
@@ -1030,17 +1336,8 @@ def integrate_enhanced_editor(converter_gui_instance):
             additional_context
         )
         
-        # Temporarily replace the input text with the enhanced prompt
-        original_get = converter_gui_instance.input_text.get
-        converter_gui_instance.input_text.get = lambda *args: full_prompt
-        
-        # Call original conversion
-        result = original_perform_conversion()
-        
-        # Restore original get method
-        converter_gui_instance.input_text.get = original_get
-        
-        return result
+        # Hand the prompt straight to the original conversion
+        return original_perform_conversion(text=full_prompt)
     
     converter_gui_instance._perform_conversion = enhanced_perform_conversion
     
@@ -5,7 +5,12 @@ Enhanced Editor Integration for VML Support
 Extends the enhanced editor with VML-specific markup types and features.
 """
 
-from enhanced_editor import MarkupDefinition, MarkupManager
+import re
+import tkinter as tk
+from collections import defaultdict
+from itertools import chain
+
+from enhanced_editor import EnhancedTextEditor, MarkupDefinition, MarkupManager
 
 def create_vml_markup_definitions():
     """Create VML-specific markup definitions for the enhanced editor"""
@@ -191,8 +196,6 @@ def integrate_vml_with_enhanced_editor(editor_instance, markup_manager):
 
 def create_vml_enhanced_editor(parent, **kwargs):
     """Create a new enhanced editor with VML support built-in"""
-    from enhanced_editor import EnhancedTextEditor
-    import tkinter as tk
     
     # Create markup manager with VML definitions
     markup_manager = MarkupManager()
@@ -213,25 +216,31 @@ def create_vml_enhanced_editor(parent, **kwargs):
     return editor, markup_manager
 
 
+def _atomic_insert(editor, text, cursor_back=0):
+    """Insert text at the cursor as one undo step, optionally stepping the cursor back"""
+    editor.edit_separator()
+    editor.insert(tk.INSERT, text)
+    if cursor_back:
+        editor.mark_set(tk.INSERT, f"{tk.INSERT}-{cursor_back}c")
+    editor.edit_separator()
+
+
 def _insert_vml_directive(editor):
     """Insert a VML directive at cursor position"""
-    editor.insert(tk.INSERT, "@directive[params] ")
-    # Move cursor back to edit directive name
-    editor.mark_set(tk.INSERT, f"{tk.INSERT}-16c")
+    # Cursor lands on the directive name
+    _atomic_insert(editor, "@directive[params] ", 16)
 
 
 def _insert_vml_variable(editor):
     """Insert a VML variable at cursor position"""
-    editor.insert(tk.INSERT, "${}")
-    # Move cursor inside braces
-    editor.mark_set(tk.INSERT, f"{tk.INSERT}-1c")
+    # Cursor lands inside the braces
+    _atomic_insert(editor, "${}", 1)
 
 
 def _insert_vml_template(editor):
     """Insert a VML template at cursor position"""
-    editor.insert(tk.INSERT, "%{}")
-    # Move cursor inside braces
-    editor.mark_set(tk.INSERT, f"{tk.INSERT}-1c")
+    # Cursor lands inside the braces
+    _atomic_insert(editor, "%{}", 1)
 
 
 # VML syntax highlighting patterns
@@ -252,11 +261,17 @@ VML_SYNTAX_PATTERNS = {
     'metadata': r'^---\s*$',
 }
 
+# Compiled once; each pattern gets its own pass because VML constructs nest
+# (a variable inside emphasis, an annotation after a directive) and every
+# match should be tagged
+_VML_SYNTAX_RES = tuple(
+    (name, re.compile(pattern, re.MULTILINE))
+    for name, pattern in VML_SYNTAX_PATTERNS.items()
+)
+
 
 def apply_vml_syntax_highlighting(text_widget):
     """Apply VML-specific syntax highlighting to a text widget"""
-    import re
-    
     # Define tag configurations for VML syntax
     syntax_tags = {
         'directive': {'foreground': '#0066CC', 'font': ('Consolas', 11, 'bold')},
@@ -274,17 +289,24 @@ def apply_vml_syntax_highlighting(text_widget):
     
     # Apply highlighting
     content = text_widget.get("1.0", tk.END)
+    line_starts = EnhancedTextEditor._compute_linecol_index(content)
+    pos = EnhancedTextEditor._offset_to_index
+    ranges = defaultdict(list)
+    
+    # Resolve line.col indices in Python so Tk never has to count characters
+    for name, pattern in _VML_SYNTAX_RES:
+        for match in pattern.finditer(content):
+            ranges[name].append(
+                (pos(line_starts, match.start()), pos(line_starts, match.end()))
+            )
     
-    for pattern_name, pattern in VML_SYNTAX_PATTERNS.items():
-        for match in re.finditer(pattern, content, re.MULTILINE):
-            start_idx = text_widget.index(f"1.0 + {match.start()} chars")
-            end_idx = text_widget.index(f"1.0 + {match.end()} chars")
-            text_widget.tag_add(f"vml_{pattern_name}", start_idx, end_idx)
+    # One tag_add per tag; Tk accepts any number of index pairs
+    for name, pairs in ranges.items():
+        text_widget.tag_add(f"vml_{name}", *chain.from_iterable(pairs))
 
 
 # Example usage
 if __name__ == "__main__":
-    import tkinter as tk
     from tkinter import ttk
     
     # Create demo window
@@ -8,21 +8,32 @@ Based on the technical specification for unified system architecture.
 
 import os
 import re
+import importlib.util
 import json
-import yaml
-import sqlite3
+import time
+import atexit
 import asyncio
 import threading
+import concurrent.futures
 import tkinter as tk
 from tkinter import ttk, scrolledtext, filedialog, messagebox, font as tkfont
 from typing import Dict, List, Tuple, Optional, Any, Set, Union
-from dataclasses import dataclass, field, asdict
-from datetime import datetime, timedelta
+from dataclasses import dataclass, field, fields, asdict, replace
+from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
+from uuid import uuid4
 from enum import Enum
 import hashlib
+import heapq
+from bisect import bisect_right
+import pickle
+from collections import OrderedDict, defaultdict
 import configparser
+from functools import lru_cache
+from itertools import chain
 from abc import ABC, abstractmethod
+from contextvars import ContextVar
 import logging
 
 # Configure logging
@@ -32,33 +43,184 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Try to import anthropic, but make it optional
+# anthropic is optional and slow to import; startup only checks that it is
+# installed, the module itself is imported by the first conversion that needs it
+@lru_cache(maxsize=None)
+def _anthropic_available() -> bool:
+    """Report whether anthropic is installed without importing it"""
+    return importlib.util.find_spec("anthropic") is not None
+
+@lru_cache(maxsize=None)
+def _get_anthropic():
+    """Import anthropic on first use; None when it cannot be imported"""
+    try:
+        import anthropic
+    except ImportError:
+        logger.warning("Anthropic module not available. API features will be disabled.")
+        return None
+    return anthropic
+
+# Optional BLAKE3 for cache keys; blake2b from hashlib otherwise
 try:
-    import anthropic
-    from anthropic import AsyncAnthropic
-    ANTHROPIC_AVAILABLE = True
+    from blake3 import blake3 as _blake3
+    BLAKE3_AVAILABLE = True
 except ImportError:
-    ANTHROPIC_AVAILABLE = False
-    logger.warning("Anthropic module not available. API features will be disabled.")
+    BLAKE3_AVAILABLE = False
+
+
+def _fast_digest(data: bytes) -> str:
+    """128-bit hex digest for cache keys; not used for anything security related"""
+    if BLAKE3_AVAILABLE:
+        return _blake3(data).hexdigest(length=16)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _cache_key(text: str, source: str, target: str,
+               markup_enabled: bool, vml_preprocessing: bool) -> str:
+    """Cache key for one conversion request
+    
+    Kept as a plain, fully typed function of primitives so it can be compiled
+    (e.g. with mypyc) on its own if key building ever shows up in profiles.
+    """
+    # Hash the text on its own so large inputs are never re-serialised
+    text_digest = _fast_digest(text.encode())
+    key_string = "\x1f".join(
+        (source, target, str(markup_enabled), str(vml_preprocessing), text_digest)
+    )
+    return _fast_digest(key_string.encode())
+
+
+# Optional orjson for cache rows; stdlib json otherwise. Both decoders accept
+# the str rows written by json and the bytes rows written by orjson
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _cache_dumps(obj: Any) -> Union[bytes, str]:
+    """Serialise a cache column value"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj)
+
+
+def _cache_loads(data: Union[bytes, str]) -> Any:
+    """Deserialise a cache column value"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Optional zstd compression for cached outputs. Frames are recognised by the
+# zstd magic number, so uncompressed rows from older caches still decode
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+# Smaller payloads are stored as-is; the frame overhead outweighs the saving
+_ZSTD_MIN_SIZE = 256
+# zstd (de)compressor objects are not thread-safe; keep one pair per thread
+_zstd_local = threading.local()
+
+
+def _zstd_codecs():
+    """Return this thread's (compressor, decompressor) pair"""
+    codecs = getattr(_zstd_local, "codecs", None)
+    if codecs is None:
+        codecs = _zstd_local.codecs = (
+            zstandard.ZstdCompressor(level=3),
+            zstandard.ZstdDecompressor(),
+        )
+    return codecs
+
+
+def _cache_pack(obj: Any) -> Union[bytes, str]:
+    """Serialise a cached result payload, compressing it when worthwhile"""
+    data = _cache_dumps(obj)
+    if not ZSTD_AVAILABLE or len(data) < _ZSTD_MIN_SIZE:
+        return data
+    if isinstance(data, str):
+        data = data.encode()
+    return _zstd_codecs()[0].compress(data)
+
+
+def _cache_unpack(data: Union[bytes, str]) -> Optional[Any]:
+    """Inverse of _cache_pack; None if the row needs zstd and it is not installed"""
+    if isinstance(data, bytes) and data.startswith(_ZSTD_MAGIC):
+        if not ZSTD_AVAILABLE:
+            return None
+        data = _zstd_codecs()[1].decompress(data)
+    return _cache_loads(data)
 
 # ============================================================================
 # CONFIGURATION SYSTEM
 # ============================================================================
 
+@lru_cache(maxsize=256)
+def _parse_bool(value: str) -> bool:
+    """Coerce a config string to bool the way ConfigParser.getboolean does"""
+    try:
+        return configparser.ConfigParser.BOOLEAN_STATES[value.lower()]
+    except KeyError:
+        raise ValueError(f"Not a boolean: {value}") from None
+
+
+@lru_cache(maxsize=256)
+def _parse_int(value: str) -> int:
+    return int(value)
+
+
+@lru_cache(maxsize=256)
+def _parse_float(value: str) -> float:
+    return float(value)
+
+
 class UnifiedConfig:
     """Centralized configuration system for all components"""
     
     def __init__(self, config_path: Optional[Path] = None):
         self.config_path = config_path or Path.home() / ".unified_converter" / "config.ini"
+        # Pickled sections written next to the INI; used while it is at least as new
+        self.cache_path = self.config_path.with_suffix(".pkl")
         self.config = configparser.ConfigParser()
+        self._cache: Dict[Tuple[str, str], str] = {}
         self._load_config()
         
     def _load_config(self):
         """Load or create default configuration"""
         if self.config_path.exists():
-            self.config.read(self.config_path)
+            if not self._load_binary_cache():
+                self.config.read(self.config_path)
         else:
             self._create_default_config()
+        self._refresh_cache()
+        
+    def _load_binary_cache(self) -> bool:
+        """Load sections from the pickle if it is not older than the INI"""
+        try:
+            if self.cache_path.stat().st_mtime < self.config_path.stat().st_mtime:
+                return False
+            with open(self.cache_path, 'rb') as f:
+                sections = pickle.load(f)
+            self.config.read_dict(sections)
+            return True
+        except (OSError, pickle.PickleError, EOFError, ValueError, TypeError, AttributeError):
+            # Missing or unreadable cache; the INI is the source of truth
+            self.config = configparser.ConfigParser()
+            return False
+        
+    def _refresh_cache(self):
+        """Mirror every section/key into a flat dict so reads skip configparser"""
+        self._cache = {
+            (section, key): value
+            for section in self.config.sections()
+            for key, value in self.config.items(section)
+        }
             
     def _create_default_config(self):
         """Create default configuration file"""
@@ -106,6 +268,10 @@ class UnifiedConfig:
             'max_file_size_mb': '10'
         }
         
+        self.config['Debug'] = {
+            'profile_conversions': 'false'
+        }
+        
         # Save default config
         self.save()
         
@@ -114,28 +280,42 @@ class UnifiedConfig:
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
         with open(self.config_path, 'w') as f:
             self.config.write(f)
+        
+        sections = {
+            section: dict(self.config.items(section, raw=True))
+            for section in self.config.sections()
+        }
+        try:
+            with open(self.cache_path, 'wb') as f:
+                pickle.dump(sections, f, protocol=5)
+        except OSError as e:
+            logger.warning(f"Could not write config cache: {e}")
             
     def get(self, section: str, key: str, fallback: Any = None) -> Any:
         """Get configuration value"""
-        return self.config.get(section, key, fallback=fallback)
+        return self._cache.get((section, self.config.optionxform(key)), fallback)
         
     def set(self, section: str, key: str, value: Any):
         """Set configuration value"""
         if section not in self.config:
             self.config[section] = {}
         self.config[section][key] = str(value)
+        self._cache[(section, self.config.optionxform(key))] = str(value)
         
     def get_bool(self, section: str, key: str, fallback: bool = False) -> bool:
         """Get boolean configuration value"""
-        return self.config.getboolean(section, key, fallback=fallback)
+        value = self.get(section, key)
+        return fallback if value is None else _parse_bool(value)
         
     def get_int(self, section: str, key: str, fallback: int = 0) -> int:
         """Get integer configuration value"""
-        return self.config.getint(section, key, fallback=fallback)
+        value = self.get(section, key)
+        return fallback if value is None else _parse_int(value)
         
     def get_float(self, section: str, key: str, fallback: float = 0.0) -> float:
         """Get float configuration value"""
-        return self.config.getfloat(section, key, fallback=fallback)
+        value = self.get(section, key)
+        return fallback if value is None else _parse_float(value)
 
 
 # ============================================================================
@@ -198,31 +378,61 @@ class ConverterInterface(ABC):
 # UNIFIED CONVERTER ENGINE
 # ============================================================================
 
+# Conversion pipeline for each known format pair; other pairs convert directly
+_CONVERSION_PATHS = MappingProxyType({
+    ('text', 'code'): (('text', 'code'),),
+    ('code', 'text'): (('code', 'text'),),
+    ('text', 'vml'): (('text', 'vml'),),
+    ('vml', 'html'): (('vml', 'html'),),
+    ('vml', 'markdown'): (('vml', 'markdown'),),
+    ('text', 'html'): (('text', 'vml'), ('vml', 'html')),
+    ('markdown', 'vml'): (('markdown', 'vml'),),
+})
+
+
+# Stage timings for the conversion running in this context; None unless profiling
+_stage_times: ContextVar[Optional[Dict[str, int]]] = ContextVar("stage_times", default=None)
+
+
+def _record_stage(name: str, started_ns: int):
+    """Add the time since started_ns to the named stage, if timings are being collected"""
+    times = _stage_times.get()
+    if times is not None:
+        times[name] = times.get(name, 0) + time.perf_counter_ns() - started_ns
+
+
 class UnifiedConverterEngine:
     """Central converter engine that orchestrates all conversion operations"""
     
     def __init__(self, config: UnifiedConfig):
         self.config = config
         self.converters: Dict[str, ConverterInterface] = {}
+        # Converter chosen for each format pair, resolved on first use
+        self._converter_by_pair: Dict[Tuple[str, str], Optional[ConverterInterface]] = {}
+        # Cache key -> result of the conversion currently computing it. Thread-safe
+        # futures, since GUI conversions each run on their own event loop
+        self._inflight: Dict[str, concurrent.futures.Future] = {}
+        self._inflight_lock = threading.Lock()
         self.cache = UnifiedCache(config)
         self.session_manager = SessionManager()
+        # Diagnostic mode: per-stage timings in result metadata, plus a
+        # pyinstrument report per conversion when pyinstrument is installed
+        self._profile = config.get_bool('Debug', 'profile_conversions', False)
         self._initialize_converters()
         
     def _initialize_converters(self):
         """Initialize all available converters"""
         # Initialize VML converter
-        from vml_converter import VMLConverter
         self.converters['vml'] = VMLConverter()
         
         # Initialize Claude converter if available
-        if ANTHROPIC_AVAILABLE and os.getenv("ANTHROPIC_API_KEY"):
-            from claude_converter import ClaudeConverter
+        if os.getenv("ANTHROPIC_API_KEY") and _anthropic_available():
             self.converters['claude'] = ClaudeConverter(self.config)
             
         # Initialize markup processor
-        from markup_processor import MarkupProcessor
         self.converters['markup'] = MarkupProcessor()
         
+        self._converter_by_pair.clear()
         logger.info(f"Initialized {len(self.converters)} converters")
         
     async def convert(self, 
@@ -231,8 +441,53 @@ class UnifiedConverterEngine:
                      target_format: str,
                      context: Optional[ConversionContext] = None) -> UnifiedConversionResult:
         """Main conversion method that determines optimal conversion path"""
-        
-        start_time = datetime.now()
+        if self._profile:
+            return await self._convert_profiled(input_text, source_format, target_format, context)
+        return await self._convert(input_text, source_format, target_format, context)
+        
+    async def _convert_profiled(self,
+                                input_text: str,
+                                source_format: str,
+                                target_format: str,
+                                context: Optional[ConversionContext]) -> UnifiedConversionResult:
+        """convert() with stage timings recorded in result.metadata['stage_times_ns']"""
+        try:
+            from pyinstrument import Profiler
+            profiler = Profiler()
+        except ImportError:
+            profiler = None
+            
+        times: Dict[str, int] = {}
+        token = _stage_times.set(times)
+        if profiler:
+            profiler.start()
+        try:
+            result = await self._convert(input_text, source_format, target_format, context)
+        finally:
+            if profiler:
+                profiler.stop()
+            _stage_times.reset(token)
+            
+        if profiler:
+            logger.info(profiler.output_text())
+        # Copy: cached results are shared objects
+        return replace(result, metadata={**result.metadata, 'stage_times_ns': times})
+        
+    async def _convert(self,
+                       input_text: str,
+                       source_format: str,
+                       target_format: str,
+                       context: Optional[ConversionContext]) -> UnifiedConversionResult:
+        """Body of convert()"""
+        start_time = time.perf_counter()
+        
+        # Nothing converts a format to itself: hand the input back untouched
+        if source_format == target_format and not self._select_converter(source_format, target_format):
+            return UnifiedConversionResult(
+                success=True,
+                output=input_text,
+                format=target_format
+            )
         
         # Create context if not provided
         if not context:
@@ -242,11 +497,44 @@ class UnifiedConverterEngine:
             )
             
         # Check cache
+        started = time.perf_counter_ns()
         cache_key = self.cache.generate_key(input_text, context)
+        _record_stage("cache_key", started)
+        started = time.perf_counter_ns()
         cached_result = await self.cache.get(cache_key)
+        _record_stage("cache_get", started)
         if cached_result:
             return cached_result
             
+        # Identical conversions already running share that run's result
+        with self._inflight_lock:
+            pending = self._inflight.get(cache_key)
+            if pending is None:
+                owned = self._inflight[cache_key] = concurrent.futures.Future()
+        if pending is not None:
+            return await asyncio.wrap_future(pending)
+            
+        try:
+            result = await self._convert_uncached(
+                input_text, source_format, target_format, context, cache_key, start_time
+            )
+            owned.set_result(result)
+            return result
+        finally:
+            if not owned.done():
+                # Cancelled mid-conversion; release anyone waiting on us
+                owned.cancel()
+            with self._inflight_lock:
+                del self._inflight[cache_key]
+                
+    async def _convert_uncached(self,
+                                input_text: str,
+                                source_format: str,
+                                target_format: str,
+                                context: ConversionContext,
+                                cache_key: str,
+                                start_time: float) -> UnifiedConversionResult:
+        """Run the conversion pipeline and cache a successful result"""
         try:
             # Determine conversion path
             conversion_path = self._determine_conversion_path(source_format, target_format)
@@ -258,10 +546,12 @@ class UnifiedConverterEngine:
             
             # Cache result
             if result.success:
+                started = time.perf_counter_ns()
                 await self.cache.set(cache_key, result)
+                _record_stage("cache_set", started)
                 
             # Update processing time
-            result.processing_time = (datetime.now() - start_time).total_seconds()
+            result.processing_time = time.perf_counter() - start_time
             
             return result
             
@@ -272,44 +562,124 @@ class UnifiedConverterEngine:
                 output="",
                 format=target_format,
                 error=str(e),
-                processing_time=(datetime.now() - start_time).total_seconds()
+                processing_time=time.perf_counter() - start_time
             )
             
-    def _determine_conversion_path(self, source: str, target: str) -> List[Tuple[str, str]]:
-        """Determine optimal conversion path between formats"""
-        # Direct conversion paths
-        direct_paths = {
-            ('text', 'code'): [('text', 'code')],
-            ('code', 'text'): [('code', 'text')],
-            ('text', 'vml'): [('text', 'vml')],
-            ('vml', 'html'): [('vml', 'html')],
-            ('vml', 'markdown'): [('vml', 'markdown')],
-        }
+    async def convert_many(self,
+                           texts: List[str],
+                           source_format: str,
+                           target_format: str,
+                           context: Optional[ConversionContext] = None) -> List[UnifiedConversionResult]:
+        """Convert several inputs, overlapping pipeline stages across them
+        
+        Each stage runs as its own task fed by a queue, so while one stage works
+        on an input the next stage can already work on the previous one.
+        """
+        start_time = time.perf_counter()
         
-        # Check for direct path
-        if (source, target) in direct_paths:
-            return direct_paths[(source, target)]
+        if not context:
+            context = ConversionContext(
+                source_format=source_format,
+                target_format=target_format
+            )
             
-        # Complex paths through intermediates
-        if source == 'text' and target == 'html':
-            return [('text', 'vml'), ('vml', 'html')]
-        elif source == 'markdown' and target == 'vml':
-            return [('markdown', 'vml')]
+        # Serve what we can from the cache; only misses enter the pipeline
+        keys = [self.cache.generate_key(text, context) for text in texts]
+        results: List[Optional[UnifiedConversionResult]] = list(
+            await asyncio.gather(*(self.cache.get(key) for key in keys))
+        )
+        misses = [i for i, result in enumerate(results) if result is None]
+        if not misses:
+            return results
+            
+        pipeline = self._determine_conversion_path(source_format, target_format)
+        queues = [asyncio.Queue() for _ in range(len(pipeline) + 1)]
+        
+        async def run_stage(source_fmt, target_fmt, inbox, outbox):
+            converter = self._select_converter(source_fmt, target_fmt)
+            stage_context = replace(context, source_format=source_fmt, target_format=target_fmt)
+            while (item := await inbox.get()) is not None:
+                index, acc = item
+                # acc carries the running output; a failure passes through untouched
+                if acc.success:
+                    acc = await self._run_stage(converter, acc, stage_context)
+                await outbox.put((index, acc))
+            await outbox.put(None)
+            
+        stages = [
+            asyncio.create_task(run_stage(source_fmt, target_fmt, queues[n], queues[n + 1]))
+            for n, (source_fmt, target_fmt) in enumerate(pipeline)
+        ]
+        for index in misses:
+            queues[0].put_nowait((index, UnifiedConversionResult(
+                success=True, output=texts[index], format=pipeline[0][0]
+            )))
+        queues[0].put_nowait(None)
+        
+        while (item := await queues[-1].get()) is not None:
+            index, result = item
+            result.processing_time = time.perf_counter() - start_time
+            results[index] = result
+        await asyncio.gather(*stages)
+        
+        await asyncio.gather(*(
+            self.cache.set(keys[i], results[i]) for i in misses if results[i].success
+        ))
+        return results
+        
+    async def _run_stage(self,
+                         converter: Optional[ConverterInterface],
+                         acc: UnifiedConversionResult,
+                         stage_context: ConversionContext) -> UnifiedConversionResult:
+        """Apply one pipeline stage to a convert_many accumulator"""
+        source_fmt, target_fmt = stage_context.source_format, stage_context.target_format
+        if not converter:
+            return UnifiedConversionResult(
+                success=False,
+                output="",
+                format=target_fmt,
+                error=f"No converter available for {source_fmt} to {target_fmt}"
+            )
+        try:
+            result = await converter.convert(acc.output, stage_context)
+        except Exception as e:
+            logger.error(f"Conversion error: {str(e)}")
+            return UnifiedConversionResult(
+                success=False, output="", format=target_fmt, error=str(e)
+            )
+        if not result.success:
+            return result
             
+        acc.output = result.output
+        acc.format = target_fmt
+        acc.intermediate_formats.append((source_fmt, target_fmt))
+        acc.tokens_used += result.tokens_used
+        acc.warnings.extend(result.warnings)
+        acc.suggestions.extend(result.suggestions)
+        return acc
+        
+    def _determine_conversion_path(self, source: str, target: str) -> Tuple[Tuple[str, str], ...]:
+        """Determine optimal conversion path between formats"""
         # Default: attempt direct conversion
-        return [(source, target)]
+        return _CONVERSION_PATHS.get((source, target)) or ((source, target),)
         
     async def _execute_conversion_pipeline(self,
                                          input_text: str,
-                                         pipeline: List[Tuple[str, str]],
+                                         pipeline: Tuple[Tuple[str, str], ...],
                                          context: ConversionContext) -> UnifiedConversionResult:
         """Execute a multi-stage conversion pipeline"""
+        if len(pipeline) == 1:
+            return await self._execute_single_stage(input_text, *pipeline[0], context)
+            
         current_text = input_text
         current_format = pipeline[0][0]
         intermediate_results = []
         total_tokens = 0
-        warnings = []
-        suggestions = []
+        # Per-stage lists, flattened once at the end
+        warning_parts = []
+        suggestion_parts = []
+        # One context shared by every stage; only the format pair changes
+        stage_context = replace(context)
         
         for source_fmt, target_fmt in pipeline:
             # Select appropriate converter
@@ -323,16 +693,12 @@ class UnifiedConverterEngine:
                 )
                 
             # Perform conversion
-            stage_context = ConversionContext(
-                source_format=source_fmt,
-                target_format=target_fmt,
-                markup_enabled=context.markup_enabled,
-                vml_preprocessing=context.vml_preprocessing,
-                custom_markup_definitions=context.custom_markup_definitions,
-                metadata=context.metadata
-            )
+            stage_context.source_format = source_fmt
+            stage_context.target_format = target_fmt
             
+            started = time.perf_counter_ns()
             result = await converter.convert(current_text, stage_context)
+            _record_stage(f"{source_fmt}->{target_fmt}", started)
             
             if not result.success:
                 return result
@@ -342,8 +708,8 @@ class UnifiedConverterEngine:
             current_format = target_fmt
             intermediate_results.append((source_fmt, target_fmt))
             total_tokens += result.tokens_used
-            warnings.extend(result.warnings)
-            suggestions.extend(result.suggestions)
+            warning_parts.append(result.warnings)
+            suggestion_parts.append(result.suggestions)
             
         # Return final result
         return UnifiedConversionResult(
@@ -352,12 +718,44 @@ class UnifiedConverterEngine:
             format=current_format,
             intermediate_formats=intermediate_results,
             tokens_used=total_tokens,
-            warnings=warnings,
-            suggestions=suggestions
+            warnings=list(chain.from_iterable(warning_parts)),
+            suggestions=list(chain.from_iterable(suggestion_parts))
         )
         
+    async def _execute_single_stage(self,
+                                    input_text: str,
+                                    source_fmt: str,
+                                    target_fmt: str,
+                                    context: ConversionContext) -> UnifiedConversionResult:
+        """Run a one-stage pipeline, returning the converter's result directly"""
+        converter = self._select_converter(source_fmt, target_fmt)
+        if not converter:
+            return UnifiedConversionResult(
+                success=False,
+                output="",
+                format=target_fmt,
+                error=f"No converter available for {source_fmt} to {target_fmt}"
+            )
+            
+        started = time.perf_counter_ns()
+        result = await converter.convert(
+            input_text, replace(context, source_format=source_fmt, target_format=target_fmt)
+        )
+        _record_stage(f"{source_fmt}->{target_fmt}", started)
+        if result.success:
+            result.format = target_fmt
+            result.intermediate_formats = [(source_fmt, target_fmt)]
+        return result
+        
     def _select_converter(self, source: str, target: str) -> Optional[ConverterInterface]:
         """Select appropriate converter for format pair"""
+        pair = (source, target)
+        if pair not in self._converter_by_pair:
+            self._converter_by_pair[pair] = self._resolve_converter(source, target)
+        return self._converter_by_pair[pair]
+        
+    def _resolve_converter(self, source: str, target: str) -> Optional[ConverterInterface]:
+        """Apply the converter selection rules to a format pair"""
         # VML conversions
         if source == 'vml' or target == 'vml':
             return self.converters.get('vml')
@@ -377,6 +775,70 @@ class UnifiedConverterEngine:
 # UNIFIED CACHE SYSTEM
 # ============================================================================
 
+# Pending cache writes are committed together once this many accumulate,
+# or on the next write after the oldest has waited this long
+_CACHE_FLUSH_BATCH = 32
+_CACHE_FLUSH_SECONDS = 2.0
+
+# Most recently used results kept in memory in front of SQLite
+_CACHE_MEMORY_ENTRIES = 1024
+
+_CACHE_INSERT_SQL = """
+    INSERT OR REPLACE INTO cache
+    (key, result, format, timestamp, tokens_used, metadata)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+# Batches of several results store their payloads back to back in one
+# cache_blob row; each cache row then points at its slice of that blob
+_CACHE_PACKED_INSERT_SQL = """
+    INSERT OR REPLACE INTO cache
+    (key, format, timestamp, tokens_used, metadata, batch_id, pack_offset, pack_length)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Expired rows are filtered here and purged with the next batched write
+_CACHE_SELECT_SQL = """
+    SELECT coalesce(c.result, substr(b.data, c.pack_offset + 1, c.pack_length)),
+           c.format, c.tokens_used, c.metadata, c.timestamp
+    FROM cache AS c LEFT JOIN cache_blob AS b ON b.batch_id = c.batch_id
+    WHERE c.key = ? AND c.timestamp > ?
+"""
+_CACHE_PURGE_SQL = "DELETE FROM cache WHERE timestamp <= ?"
+_CACHE_PURGE_BLOBS_SQL = """
+    DELETE FROM cache_blob
+    WHERE batch_id NOT IN (SELECT batch_id FROM cache WHERE batch_id IS NOT NULL)
+"""
+
+
+class _KeyBloomFilter:
+    """Bloom filter over cache keys, answering "definitely not cached" cheaply"""
+    
+    _HASHES = 7  # optimal for a 1% false-positive rate
+    _BITS_PER_KEY = 10
+    
+    def __init__(self, capacity: int):
+        self.capacity = max(capacity, 1024)
+        self._size = self.capacity * self._BITS_PER_KEY
+        self._bits = bytearray(self._size // 8 + 1)
+        self.count = 0
+        
+    def _positions(self, key: str):
+        # Double hashing from one 128-bit digest of the key
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self._size for i in range(self._HASHES))
+        
+    def add(self, key: str):
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+        
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
 class UnifiedCache:
     """Unified caching system for all conversion results"""
     
@@ -384,140 +846,313 @@ class UnifiedCache:
         self.config = config
         self.cache_path = Path.home() / ".unified_converter" / "cache.db"
         self.ttl_hours = config.get_int('API', 'cache_ttl_hours', 24)
-        self._init_db()
+        # One connection shared by every conversion thread, guarded by _lock
+        self._lock = threading.Lock()
+        # key -> row awaiting the next batched commit
+        self._pending: Dict[str, tuple] = {}
+        self._pending_since = 0.0
+        # key -> (timestamp, result), least recently used first
+        self._mem: "OrderedDict[str, Tuple[float, UnifiedConversionResult]]" = OrderedDict()
+        self._conn = self._init_db()
+        # Every key ever stored; a miss here skips the SQLite lookup entirely
+        self._bloom = self._build_bloom()
+        atexit.register(self.flush)
         
     def _init_db(self):
-        """Initialize cache database"""
+        """Initialize cache database and return the shared connection"""
+        import sqlite3
         self.cache_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with sqlite3.connect(self.cache_path) as conn:
+        conn = sqlite3.connect(self.cache_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        with conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS cache (
                     key TEXT PRIMARY KEY,
-                    result TEXT,
+                    result BLOB,
                     format TEXT,
                     timestamp REAL,
                     tokens_used INTEGER,
-                    metadata TEXT
+                    metadata BLOB
                 )
             """)
             conn.execute("CREATE INDEX IF NOT EXISTS idx_timestamp ON cache(timestamp)")
-            
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache_blob (
+                    batch_id INTEGER PRIMARY KEY,
+                    data BLOB
+                )
+            """)
+            # Caches created before packed batches lack the pointer columns
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(cache)")}
+            for column in ("batch_id", "pack_offset", "pack_length"):
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE cache ADD COLUMN {column} INTEGER")
+        return conn
+            
+    def _build_bloom(self) -> _KeyBloomFilter:
+        """Fill a bloom filter, sized with headroom, from every stored and pending key"""
+        keys = [row[0] for row in self._conn.execute("SELECT key FROM cache")]
+        keys.extend(self._pending)
+        bloom = _KeyBloomFilter(2 * len(keys))
+        for key in keys:
+            bloom.add(key)
+        return bloom
+        
     def generate_key(self, text: str, context: ConversionContext) -> str:
         """Generate cache key from input and context"""
-        key_data = {
-            'text': text,
-            'source': context.source_format,
-            'target': context.target_format,
-            'markup': context.markup_enabled,
-            'vml': context.vml_preprocessing
-        }
-        key_string = json.dumps(key_data, sort_keys=True)
-        return hashlib.sha256(key_string.encode()).hexdigest()
+        return _cache_key(
+            text,
+            context.source_format,
+            context.target_format,
+            context.markup_enabled,
+            context.vml_preprocessing,
+        )
         
     async def get(self, key: str) -> Optional[UnifiedConversionResult]:
-        """Retrieve cached result"""
-        with sqlite3.connect(self.cache_path) as conn:
-            cursor = conn.execute(
-                "SELECT result, format, timestamp, tokens_used, metadata FROM cache WHERE key = ?",
-                (key,)
-            )
-            row = cursor.fetchone()
-            
-            if row:
-                # Check TTL
-                timestamp = datetime.fromtimestamp(row[2])
-                if datetime.now() - timestamp > timedelta(hours=self.ttl_hours):
-                    # Expired
-                    conn.execute("DELETE FROM cache WHERE key = ?", (key,))
-                    return None
-                    
-                # Deserialize result
-                result_data = json.loads(row[0])
-                return UnifiedConversionResult(
-                    success=True,
-                    output=result_data['output'],
-                    format=row[1],
-                    tokens_used=row[3],
-                    metadata=json.loads(row[4]),
-                    cached=True
-                )
+        """Retrieve cached result from memory, else from SQLite off the event loop"""
+        result = self._memory_get(key)
+        if result is not None:
+            return result
+        return await asyncio.to_thread(self._get_sync, key)
+        
+    def _get_sync(self, key: str) -> Optional[UnifiedConversionResult]:
+        """Blocking body of get()"""
+        cutoff = self._ttl_cutoff()
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is not None:
+                # Same column order as _CACHE_SELECT_SQL
+                row = (pending[1], pending[2], pending[4], pending[5], pending[3]) if pending[3] > cutoff else None
+            elif key not in self._bloom:
+                row = None
+            else:
+                row = self._conn.execute(_CACHE_SELECT_SQL, (key, cutoff)).fetchone()
                 
-        return None
+        if row is None:
+            return None
+            
+        # Deserialize result
+        result_data = _cache_unpack(row[0])
+        if result_data is None:
+            return None
+        result = UnifiedConversionResult(
+            success=True,
+            output=result_data['output'],
+            format=row[1],
+            tokens_used=row[2],
+            metadata=_cache_loads(row[3]),
+            cached=True
+        )
+        with self._lock:
+            self._memory_put(key, row[4], result)
+        return result
+        
+    def _memory_get(self, key: str) -> Optional[UnifiedConversionResult]:
+        """Return an unexpired in-memory result, marking it most recently used"""
+        with self._lock:
+            entry = self._mem.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= self._ttl_cutoff():
+                del self._mem[key]
+                return None
+            self._mem.move_to_end(key)
+            return entry[1]
+            
+    def _memory_put(self, key: str, timestamp: float, result: UnifiedConversionResult):
+        """Store a result in the in-memory tier; caller holds _lock"""
+        self._mem[key] = (timestamp, result)
+        self._mem.move_to_end(key)
+        if len(self._mem) > _CACHE_MEMORY_ENTRIES:
+            self._mem.popitem(last=False)
+        
+    def _ttl_cutoff(self) -> float:
+        """Timestamp before which cached rows have expired"""
+        return time.time() - self.ttl_hours * 3600
         
     async def set(self, key: str, result: UnifiedConversionResult):
-        """Cache conversion result"""
-        with sqlite3.connect(self.cache_path) as conn:
-            result_data = {
-                'output': result.output,
-                'warnings': result.warnings,
-                'suggestions': result.suggestions
-            }
-            
-            conn.execute("""
-                INSERT OR REPLACE INTO cache 
-                (key, result, format, timestamp, tokens_used, metadata)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                key,
-                json.dumps(result_data),
-                result.format,
-                datetime.now().timestamp(),
-                result.tokens_used,
-                json.dumps(result.metadata)
-            ))
+        """Cache conversion result; the write is committed with the next batch"""
+        await asyncio.to_thread(self._set_sync, key, result)
+        
+    def _set_sync(self, key: str, result: UnifiedConversionResult):
+        """Blocking body of set()"""
+        result_data = {
+            'output': result.output,
+            'warnings': result.warnings,
+            'suggestions': result.suggestions
+        }
+        row = (
+            key,
+            _cache_pack(result_data),
+            result.format,
+            time.time(),
+            result.tokens_used,
+            _cache_dumps(result.metadata)
+        )
+        
+        with self._lock:
+            self._memory_put(key, row[3], replace(result, cached=True))
+            if not self._pending:
+                self._pending_since = time.monotonic()
+            self._pending[key] = row
+            self._bloom.add(key)
+            if self._bloom.count > self._bloom.capacity:
+                # Past its design load the false-positive rate climbs; resize
+                self._bloom = self._build_bloom()
+            if (len(self._pending) >= _CACHE_FLUSH_BATCH
+                    or time.monotonic() - self._pending_since >= _CACHE_FLUSH_SECONDS):
+                self._flush_locked()
+                
+    def flush(self):
+        """Commit any pending cache writes"""
+        with self._lock:
+            self._flush_locked()
+            
+    def clear(self):
+        """Delete every stored, pending and in-memory result"""
+        with self._lock:
+            self._pending.clear()
+            self._mem.clear()
+            with self._conn:
+                self._conn.execute("DELETE FROM cache")
+                self._conn.execute("DELETE FROM cache_blob")
+            self._bloom = self._build_bloom()
+            
+    def _flush_locked(self):
+        """Write every pending row and drop expired ones in one transaction; caller holds _lock"""
+        if not self._pending:
+            return
+        with self._conn:
+            if len(self._pending) == 1:
+                self._conn.executemany(_CACHE_INSERT_SQL, self._pending.values())
+            else:
+                self._write_packed(list(self._pending.values()))
+            self._conn.execute(_CACHE_PURGE_SQL, (self._ttl_cutoff(),))
+            self._conn.execute(_CACHE_PURGE_BLOBS_SQL)
+        self._pending.clear()
+        
+    def _write_packed(self, rows: List[tuple]):
+        """Store a batch's payloads as one blob row plus a pointer row per key"""
+        payloads = [
+            payload.encode() if isinstance(payload, str) else payload
+            for payload in (row[1] for row in rows)
+        ]
+        batch_id = self._conn.execute(
+            "INSERT INTO cache_blob (data) VALUES (?)", (b"".join(payloads),)
+        ).lastrowid
+        
+        pointers = []
+        offset = 0
+        for (key, _, fmt, timestamp, tokens_used, metadata), payload in zip(rows, payloads):
+            pointers.append((key, fmt, timestamp, tokens_used, metadata, batch_id, offset, len(payload)))
+            offset += len(payload)
+        self._conn.executemany(_CACHE_PACKED_INSERT_SQL, pointers)
 
 
 # ============================================================================
 # SESSION MANAGEMENT
 # ============================================================================
 
+@dataclass(slots=True)
+class Session:
+    """State kept for one user session"""
+    created: datetime = field(default_factory=datetime.now)
+    # time.monotonic() seconds; only compared, never displayed
+    last_active: float = 0.0
+    history: List[Any] = field(default_factory=list)
+    context: Dict[str, Any] = field(default_factory=dict)
+    # Caller-defined values that have no field of their own
+    data: Dict[str, Any] = field(default_factory=dict)
+
+
+_SESSION_FIELDS = frozenset(f.name for f in fields(Session))
+
+
 class SessionManager:
     """Manage user sessions for continuous context"""
     
     def __init__(self):
-        self.sessions: Dict[str, Dict[str, Any]] = {}
+        self.sessions: Dict[str, Session] = {}
+        # (last_active, session_id) for every touch; entries whose time no longer
+        # matches the session are stale and skipped when popped
+        self._expiry_heap: List[Tuple[float, str]] = []
         
     def create_session(self) -> str:
         """Create new session"""
-        import uuid
-        session_id = str(uuid.uuid4())
-        self.sessions[session_id] = {
-            'created': datetime.now(),
-            'last_active': datetime.now(),
-            'history': [],
-            'context': {}
-        }
+        session_id = uuid4().hex
+        self.sessions[session_id] = Session()
+        self._touch(session_id)
         return session_id
         
-    def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+    def get_session(self, session_id: str) -> Optional[Session]:
         """Get session data"""
         if session_id in self.sessions:
-            self.sessions[session_id]['last_active'] = datetime.now()
+            self._touch(session_id)
             return self.sessions[session_id]
         return None
         
     def update_session(self, session_id: str, data: Dict[str, Any]):
-        """Update session data"""
-        if session_id in self.sessions:
-            self.sessions[session_id].update(data)
-            self.sessions[session_id]['last_active'] = datetime.now()
+        """Update session data; keys naming a Session field set that field"""
+        session = self.sessions.get(session_id)
+        if session is not None:
+            for name, value in data.items():
+                if name in _SESSION_FIELDS:
+                    setattr(session, name, value)
+                else:
+                    session.data[name] = value
+            self._touch(session_id)
+            
+    def _touch(self, session_id: str):
+        """Mark a session active now and queue its new expiry"""
+        now = time.monotonic()
+        self.sessions[session_id].last_active = now
+        heapq.heappush(self._expiry_heap, (now, session_id))
+        # Stale entries pile up between cleanups; compact once they dominate
+        if len(self._expiry_heap) > 4 * len(self.sessions) + 64:
+            self._expiry_heap = [
+                (session.last_active, sid) for sid, session in self.sessions.items()
+            ]
+            heapq.heapify(self._expiry_heap)
             
     def cleanup_expired(self, ttl_hours: int = 24):
         """Remove expired sessions"""
-        cutoff = datetime.now() - timedelta(hours=ttl_hours)
-        expired = [
-            sid for sid, data in self.sessions.items()
-            if data['last_active'] < cutoff
-        ]
-        for sid in expired:
-            del self.sessions[sid]
+        cutoff = time.monotonic() - ttl_hours * 3600
+        heap = self._expiry_heap
+        while heap and heap[0][0] < cutoff:
+            last_active, sid = heapq.heappop(heap)
+            session = self.sessions.get(sid)
+            # Only the entry matching the latest touch can expire the session
+            if session is not None and session.last_active == last_active:
+                del self.sessions[sid]
 
 
 # ============================================================================
 # UNIFIED GUI APPLICATION
 # ============================================================================
 
+# Editor highlighting patterns, compiled once at import
+_MARKUP_PATTERNS: List[Tuple[str, re.Pattern]] = [
+    ("emphasis", re.compile(r'!!([^!]+)!!')),
+    ("context", re.compile(r'<~([^~]+)~>')),
+    ("note", re.compile(r'\(\*([^*]+)\*\)')),
+    ("warning", re.compile(r'/!([^!]+)!/')),
+    ("success", re.compile(r'/\+([^+]+)\+/')),
+]
+_VML_PATTERNS: List[Tuple[str, re.Pattern]] = [
+    ("vml_heading", re.compile(r'^#{1,6}\s+.+$', re.MULTILINE)),
+    ("vml_directive", re.compile(r'@\w+(?:\[[^\]]*\])?')),
+    ("vml_variable", re.compile(r'\$\{[^}]+\}')),
+    ("vml_template", re.compile(r'%\{[^}]+\}')),
+    ("vml_section", re.compile(r'^::\s*/?\w+(?:\[[^\]]*\])?', re.MULTILINE)),
+    ("vml_metadata", re.compile(r'^---$', re.MULTILINE)),
+]
+_MARKUP_TAGS = tuple(tag for tag, _ in _MARKUP_PATTERNS)
+_VML_TAGS = tuple(tag for tag, _ in _VML_PATTERNS)
+
 class UnifiedConverterGUI:
     """Main GUI application integrating all components"""
     
@@ -527,6 +1162,13 @@ class UnifiedConverterGUI:
         self.engine = UnifiedConverterEngine(self.config)
         self.session_id = self.engine.session_manager.create_session()
         
+        # Config values read while building the UI
+        self._editor_font = (self.config.get('Editor', 'font_family', 'Consolas'),
+                             self.config.get_int('Editor', 'font_size', 11))
+        self._show_toolbar = self.config.get_bool('UI', 'show_toolbar', True)
+        self._show_sidebar = self.config.get_bool('UI', 'show_sidebar', False)
+        self._show_status_bar = self.config.get_bool('UI', 'show_status_bar', True)
+        
         # Setup UI
         self._setup_window()
         self._setup_styles()
@@ -540,6 +1182,8 @@ class UnifiedConverterGUI:
         self.current_file = None
         self.modified = False
         self.conversion_history = []
+        self._hl_after_id = None
+        self._hl_line_counts = {}
         
         # Initialize with example content
         self._load_welcome_content()
@@ -620,9 +1264,26 @@ class UnifiedConverterGUI:
         edit_menu.add_command(label="Find...", command=self._find, accelerator="Ctrl+F")
         edit_menu.add_command(label="Replace...", command=self._replace, accelerator="Ctrl+H")
         
-        # Convert menu
-        convert_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Convert", menu=convert_menu)
+        # Remaining menus are populated the first time they are posted
+        self._add_lazy_cascade(menubar, "Convert", self._populate_convert_menu)
+        self._add_lazy_cascade(menubar, "Markup", self._populate_markup_menu)
+        self._add_lazy_cascade(menubar, "VML", self._populate_vml_menu)
+        self._add_lazy_cascade(menubar, "Tools", self._populate_tools_menu)
+        self._add_lazy_cascade(menubar, "Help", self._populate_help_menu)
+        
+    def _add_lazy_cascade(self, menubar, label, populate):
+        """Add a cascade whose entries are created on first post"""
+        menu = tk.Menu(menubar, tearoff=0)
+        
+        def build():
+            menu.configure(postcommand="")
+            populate(menu)
+            
+        menu.configure(postcommand=build)
+        menubar.add_cascade(label=label, menu=menu)
+        
+    def _populate_convert_menu(self, convert_menu):
+        """Populate Convert menu"""
         convert_menu.add_command(label="Quick Convert", command=self._quick_convert, accelerator="F5")
         convert_menu.add_separator()
         convert_menu.add_command(label="Text to Code", command=lambda: self._set_mode('text', 'code'))
@@ -633,9 +1294,8 @@ class UnifiedConverterGUI:
         convert_menu.add_separator()
         convert_menu.add_command(label="Batch Convert...", command=self._batch_convert)
         
-        # Markup menu
-        markup_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Markup", menu=markup_menu)
+    def _populate_markup_menu(self, markup_menu):
+        """Populate Markup menu"""
         markup_menu.add_command(label="Apply Emphasis", command=lambda: self._apply_markup('emphasis'))
         markup_menu.add_command(label="Apply Context", command=lambda: self._apply_markup('context'))
         markup_menu.add_command(label="Apply Warning", command=lambda: self._apply_markup('warning'))
@@ -645,9 +1305,8 @@ class UnifiedConverterGUI:
         markup_menu.add_command(label="Export Markup Definitions", command=self._export_markup)
         markup_menu.add_command(label="Import Markup Definitions", command=self._import_markup)
         
-        # VML menu
-        vml_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="VML", menu=vml_menu)
+    def _populate_vml_menu(self, vml_menu):
+        """Populate VML menu"""
         vml_menu.add_command(label="Validate", command=self._validate_vml, accelerator="F7")
         vml_menu.add_command(label="Format", command=self._format_vml, accelerator="F8")
         vml_menu.add_separator()
@@ -658,9 +1317,8 @@ class UnifiedConverterGUI:
         vml_menu.add_separator()
         vml_menu.add_command(label="VML Reference", command=self._show_vml_reference)
         
-        # Tools menu
-        tools_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Tools", menu=tools_menu)
+    def _populate_tools_menu(self, tools_menu):
+        """Populate Tools menu"""
         tools_menu.add_command(label="API Settings...", command=self._show_api_settings)
         tools_menu.add_command(label="Editor Preferences...", command=self._show_editor_preferences)
         tools_menu.add_command(label="Clear Cache", command=self._clear_cache)
@@ -670,9 +1328,8 @@ class UnifiedConverterGUI:
         tools_menu.add_separator()
         tools_menu.add_command(label="Plugin Manager...", command=self._show_plugin_manager)
         
-        # Help menu
-        help_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Help", menu=help_menu)
+    def _populate_help_menu(self, help_menu):
+        """Populate Help menu"""
         help_menu.add_command(label="Documentation", command=self._show_documentation, accelerator="F1")
         help_menu.add_command(label="Keyboard Shortcuts", command=self._show_shortcuts)
         help_menu.add_command(label="Tutorial", command=self._show_tutorial)
@@ -684,7 +1341,7 @@ class UnifiedConverterGUI:
         
     def _create_toolbar(self):
         """Create application toolbar"""
-        if not self.config.get_bool('UI', 'show_toolbar', True):
+        if not self._show_toolbar:
             return
             
         toolbar = ttk.Frame(self.root)
@@ -759,10 +1416,17 @@ class UnifiedConverterGUI:
         self.editor_notebook = ttk.Notebook(left_panel)
         self.editor_notebook.pack(fill=tk.BOTH, expand=True)
         
-        # Create editor tabs
+        # Create editor tabs; only the visible one is built up front
+        self._tab_builders = {}
+        self._highlighters = {}
         self._create_editor_tab()
-        self._create_markup_tab()
-        self._create_vml_tab()
+        self._markup_frame = self._add_lazy_tab(
+            self.editor_notebook, "Enhanced Markup", self._create_markup_tab)
+        self._vml_frame = self._add_lazy_tab(
+            self.editor_notebook, "VML Editor", self._create_vml_tab)
+        self.editor_notebook.bind("<<NotebookTabChanged>>", self._on_lazy_tab_changed)
+        self.editor_notebook.bind("<<NotebookTabChanged>>", self._on_editor_tab_changed, add="+")
+        self._current_editor = self.main_editor
         
         # Right panel - Output/Preview
         right_panel = ttk.Frame(self.main_paned)
@@ -774,14 +1438,62 @@ class UnifiedConverterGUI:
         
         # Create output tabs
         self._create_output_tab()
-        self._create_preview_tab()
-        self._create_metadata_tab()
-        self._create_history_tab()
+        self._preview_frame = self._add_lazy_tab(
+            self.output_notebook, "Preview", self._create_preview_tab)
+        self._metadata_frame = self._add_lazy_tab(
+            self.output_notebook, "Metadata", self._create_metadata_tab)
+        self._history_frame = self._add_lazy_tab(
+            self.output_notebook, "History", self._create_history_tab)
+        self.output_notebook.bind("<<NotebookTabChanged>>", self._on_lazy_tab_changed)
         
         # Sidebar (optional)
-        if self.config.get_bool('UI', 'show_sidebar', False):
+        if self._show_sidebar:
             self._create_sidebar()
             
+    def _add_lazy_tab(self, notebook, text, builder):
+        """Add a placeholder tab whose contents are built on first use"""
+        frame = ttk.Frame(notebook)
+        notebook.add(frame, text=text)
+        self._tab_builders[str(frame)] = (builder, frame)
+        return frame
+        
+    def _ensure_tab(self, frame):
+        """Build a lazy tab if it has not been built yet"""
+        entry = self._tab_builders.pop(str(frame), None)
+        if entry:
+            builder, frame = entry
+            builder(frame)
+            
+    def _on_lazy_tab_changed(self, event):
+        """Build a tab's contents the first time it is selected"""
+        self._ensure_tab(event.widget.select())
+        
+    # Widgets inside lazy tabs; touching one builds its tab
+    @property
+    def markup_editor(self):
+        self._ensure_tab(self._markup_frame)
+        return self._markup_editor
+        
+    @property
+    def vml_editor(self):
+        self._ensure_tab(self._vml_frame)
+        return self._vml_editor
+        
+    @property
+    def preview_text(self):
+        self._ensure_tab(self._preview_frame)
+        return self._preview_text
+        
+    @property
+    def metadata_tree(self):
+        self._ensure_tab(self._metadata_frame)
+        return self._metadata_tree
+        
+    @property
+    def history_tree(self):
+        self._ensure_tab(self._history_frame)
+        return self._history_tree
+        
     def _create_editor_tab(self):
         """Create main editor tab"""
         editor_frame = ttk.Frame(self.editor_notebook)
@@ -805,8 +1517,7 @@ class UnifiedConverterGUI:
         # Editor
         self.main_editor = scrolledtext.ScrolledText(
             editor_frame, wrap=tk.WORD, 
-            font=(self.config.get('Editor', 'font_family', 'Consolas'),
-                  self.config.get_int('Editor', 'font_size', 11)),
+            font=self._editor_font,
             undo=True, maxundo=-1
         )
         self.main_editor.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
@@ -814,11 +1525,8 @@ class UnifiedConverterGUI:
         # Configure editor
         self._configure_editor(self.main_editor)
         
-    def _create_markup_tab(self):
+    def _create_markup_tab(self, markup_frame):
         """Create markup editor tab"""
-        markup_frame = ttk.Frame(self.editor_notebook)
-        self.editor_notebook.add(markup_frame, text="Enhanced Markup")
-        
         # Markup toolbar
         markup_toolbar = ttk.Frame(markup_frame)
         markup_toolbar.pack(fill=tk.X, padx=5, pady=5)
@@ -839,22 +1547,18 @@ class UnifiedConverterGUI:
             self._create_tooltip(btn, tooltip)
             
         # Markup editor
-        self.markup_editor = scrolledtext.ScrolledText(
+        self._markup_editor = scrolledtext.ScrolledText(
             markup_frame, wrap=tk.WORD,
-            font=(self.config.get('Editor', 'font_family', 'Consolas'),
-                  self.config.get_int('Editor', 'font_size', 11)),
+            font=self._editor_font,
             undo=True, maxundo=-1
         )
-        self.markup_editor.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self._markup_editor.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Configure markup highlighting
-        self._configure_markup_editor(self.markup_editor)
+        self._configure_markup_editor(self._markup_editor)
         
-    def _create_vml_tab(self):
+    def _create_vml_tab(self, vml_frame):
         """Create VML editor tab"""
-        vml_frame = ttk.Frame(self.editor_notebook)
-        self.editor_notebook.add(vml_frame, text="VML Editor")
-        
         # VML toolbar
         vml_toolbar = ttk.Frame(vml_frame)
         vml_toolbar.pack(fill=tk.X, padx=5, pady=5)
@@ -880,16 +1584,15 @@ class UnifiedConverterGUI:
         ttk.Button(vml_toolbar, text="Format", command=self._format_vml).pack(side=tk.LEFT, padx=2)
         
         # VML editor
-        self.vml_editor = scrolledtext.ScrolledText(
+        self._vml_editor = scrolledtext.ScrolledText(
             vml_frame, wrap=tk.WORD,
-            font=(self.config.get('Editor', 'font_family', 'Consolas'),
-                  self.config.get_int('Editor', 'font_size', 11)),
+            font=self._editor_font,
             undo=True, maxundo=-1
         )
-        self.vml_editor.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self._vml_editor.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Configure VML syntax highlighting
-        self._configure_vml_editor(self.vml_editor)
+        self._configure_vml_editor(self._vml_editor)
         
     def _create_output_tab(self):
         """Create output display tab"""
@@ -907,43 +1610,33 @@ class UnifiedConverterGUI:
         # Output display
         self.output_text = scrolledtext.ScrolledText(
             output_frame, wrap=tk.WORD,
-            font=(self.config.get('Editor', 'font_family', 'Consolas'),
-                  self.config.get_int('Editor', 'font_size', 11)),
+            font=self._editor_font,
             state=tk.DISABLED
         )
         self.output_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-    def _create_preview_tab(self):
+    def _create_preview_tab(self, preview_frame):
         """Create preview tab for HTML/formatted output"""
-        preview_frame = ttk.Frame(self.output_notebook)
-        self.output_notebook.add(preview_frame, text="Preview")
-        
         # For now, use a text widget - could be replaced with webview
-        self.preview_text = scrolledtext.ScrolledText(
+        self._preview_text = scrolledtext.ScrolledText(
             preview_frame, wrap=tk.WORD,
             font=("Arial", 11),
             state=tk.DISABLED
         )
-        self.preview_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self._preview_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-    def _create_metadata_tab(self):
+    def _create_metadata_tab(self, metadata_frame):
         """Create metadata display tab"""
-        metadata_frame = ttk.Frame(self.output_notebook)
-        self.output_notebook.add(metadata_frame, text="Metadata")
-        
         # Metadata tree view
-        self.metadata_tree = ttk.Treeview(
+        self._metadata_tree = ttk.Treeview(
             metadata_frame, columns=("value",), show="tree headings"
         )
-        self.metadata_tree.heading("#0", text="Property")
-        self.metadata_tree.heading("value", text="Value")
-        self.metadata_tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self._metadata_tree.heading("#0", text="Property")
+        self._metadata_tree.heading("value", text="Value")
+        self._metadata_tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-    def _create_history_tab(self):
+    def _create_history_tab(self, history_frame):
         """Create conversion history tab"""
-        history_frame = ttk.Frame(self.output_notebook)
-        self.output_notebook.add(history_frame, text="History")
-        
         # History controls
         history_controls = ttk.Frame(history_frame)
         history_controls.pack(fill=tk.X, padx=5, pady=5)
@@ -952,30 +1645,30 @@ class UnifiedConverterGUI:
         ttk.Button(history_controls, text="Export History", command=self._export_history).pack(side=tk.LEFT, padx=2)
         
         # History list
-        self.history_tree = ttk.Treeview(
+        self._history_tree = ttk.Treeview(
             history_frame, 
             columns=("time", "source", "target", "tokens", "cached"),
             show="tree headings"
         )
-        self.history_tree.heading("#0", text="ID")
-        self.history_tree.heading("time", text="Time")
-        self.history_tree.heading("source", text="Source")
-        self.history_tree.heading("target", text="Target")
-        self.history_tree.heading("tokens", text="Tokens")
-        self.history_tree.heading("cached", text="Cached")
+        self._history_tree.heading("#0", text="ID")
+        self._history_tree.heading("time", text="Time")
+        self._history_tree.heading("source", text="Source")
+        self._history_tree.heading("target", text="Target")
+        self._history_tree.heading("tokens", text="Tokens")
+        self._history_tree.heading("cached", text="Cached")
         
         # Configure column widths
-        self.history_tree.column("#0", width=50)
-        self.history_tree.column("time", width=150)
-        self.history_tree.column("source", width=100)
-        self.history_tree.column("target", width=100)
-        self.history_tree.column("tokens", width=80)
-        self.history_tree.column("cached", width=80)
+        self._history_tree.column("#0", width=50)
+        self._history_tree.column("time", width=150)
+        self._history_tree.column("source", width=100)
+        self._history_tree.column("target", width=100)
+        self._history_tree.column("tokens", width=80)
+        self._history_tree.column("cached", width=80)
         
-        self.history_tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self._history_tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Bind double-click to load conversion
-        self.history_tree.bind("<Double-Button-1>", self._load_from_history)
+        self._history_tree.bind("<Double-Button-1>", self._load_from_history)
         
     def _create_sidebar(self):
         """Create optional sidebar"""
@@ -1000,7 +1693,7 @@ class UnifiedConverterGUI:
             
     def _create_status_bar(self):
         """Create status bar"""
-        if not self.config.get_bool('UI', 'show_status_bar', True):
+        if not self._show_status_bar:
             return
             
         status_frame = ttk.Frame(self.root)
@@ -1066,9 +1759,20 @@ class UnifiedConverterGUI:
         editor.tag_configure("number", foreground="#FF0000")
         
         # Bind events
-        editor.bind("<KeyRelease>", lambda e: self._on_editor_change(editor))
+        self._bind_modified(editor, lambda: self._on_editor_change(editor))
+        editor.bind("<KeyRelease>", lambda e: self._update_cursor_position(editor))
         editor.bind("<ButtonRelease>", lambda e: self._update_cursor_position(editor))
         
+    def _bind_modified(self, editor, callback):
+        """Run callback when the editor content changes, not on every key"""
+        def on_modified(event):
+            # Resetting the flag fires <<Modified>> again; skip that one
+            if editor.edit_modified():
+                editor.edit_modified(False)
+                callback()
+                
+        editor.bind("<<Modified>>", on_modified)
+        
     def _configure_markup_editor(self, editor):
         """Configure markup editor with custom highlighting"""
         # Markup-specific tags
@@ -1079,7 +1783,9 @@ class UnifiedConverterGUI:
         editor.tag_configure("success", foreground="#2E7D32", background="#E8F5E9")
         
         # Bind events
-        editor.bind("<KeyRelease>", lambda e: self._update_markup_highlighting(editor))
+        self._highlighters[str(editor)] = self._update_markup_highlighting
+        self._bind_modified(
+            editor, lambda: self._schedule_highlighting(editor, self._update_markup_highlighting))
         editor.bind("<Button-3>", lambda e: self._show_markup_menu(e, editor))
         
     def _configure_vml_editor(self, editor):
@@ -1093,21 +1799,21 @@ class UnifiedConverterGUI:
         editor.tag_configure("vml_metadata", foreground="#37474F", background="#ECEFF1")
         
         # Bind events
-        editor.bind("<KeyRelease>", lambda e: self._update_vml_highlighting(editor))
+        self._highlighters[str(editor)] = self._update_vml_highlighting
+        self._bind_modified(
+            editor, lambda: self._schedule_highlighting(editor, self._update_vml_highlighting))
+        
+    # Editor attribute for each editor notebook tab index
+    _EDITOR_TABS = {0: "main_editor", 1: "markup_editor", 2: "vml_editor"}
+    
+    def _on_editor_tab_changed(self, event):
+        """Remember the editor of the newly selected tab"""
+        index = self.editor_notebook.index("current")
+        self._current_editor = getattr(self, self._EDITOR_TABS.get(index, "main_editor"))
         
     def _get_current_editor(self):
         """Get currently active editor"""
-        current_tab = self.editor_notebook.select()
-        tab_index = self.editor_notebook.index(current_tab)
-        
-        if tab_index == 0:
-            return self.main_editor
-        elif tab_index == 1:
-            return self.markup_editor
-        elif tab_index == 2:
-            return self.vml_editor
-        else:
-            return self.main_editor
+        return self._current_editor
             
     def _on_editor_change(self, editor):
         """Handle editor content change"""
@@ -1126,58 +1832,82 @@ class UnifiedConverterGUI:
         # language-specific parsers and lexers
         pass
         
-    def _update_markup_highlighting(self, editor):
-        """Update markup highlighting"""
-        # Remove existing tags
-        for tag in ["emphasis", "context", "note", "warning", "success"]:
-            editor.tag_remove(tag, "1.0", tk.END)
-            
-        content = editor.get("1.0", tk.END)
-        
-        # Highlight patterns
-        patterns = {
-            "emphasis": r'!!([^!]+)!!',
-            "context": r'<~([^~]+)~>',
-            "note": r'\(\*([^*]+)\*\)',
-            "warning": r'/!([^!]+)!/',
-            "success": r'/\+([^+]+)\+/',
-        }
-        
-        for tag_name, pattern in patterns.items():
-            for match in re.finditer(pattern, content):
-                start_idx = f"1.0 + {match.start()} chars"
-                end_idx = f"1.0 + {match.end()} chars"
-                editor.tag_add(tag_name, start_idx, end_idx)
+    # Lines around the cursor re-scanned after a keystroke
+    _HIGHLIGHT_CONTEXT_LINES = 5
+    _HIGHLIGHT_DELAY_MS = 80
+    
+    def _schedule_highlighting(self, editor, highlighter):
+        """Debounce highlighting so a burst of keystrokes costs one re-scan"""
+        if self._hl_after_id:
+            self.root.after_cancel(self._hl_after_id)
+        self._hl_after_id = self.root.after(
+            self._HIGHLIGHT_DELAY_MS, self._rehighlight_region, editor, highlighter)
+        
+    def _rehighlight_region(self, editor, highlighter):
+        """Re-highlight the lines around the insert cursor"""
+        self._hl_after_id = None
+        # Lines added since the last pass (paste, undo, redo) end at the
+        # cursor, so reach back over them as well as the usual context
+        line_count = int(editor.index("end-1c").split('.')[0])
+        added = max(line_count - self._hl_line_counts.get(str(editor), line_count), 0)
+        self._hl_line_counts[str(editor)] = line_count
+        
+        lines = self._HIGHLIGHT_CONTEXT_LINES
+        start = editor.index(f"insert -{lines + added}l linestart")
+        end = editor.index(f"insert +{lines}l lineend")
+        highlighter(editor, start, end)
+        
+    def _update_markup_highlighting(self, editor, start="1.0", end=tk.END):
+        """Update markup highlighting between start and end"""
+        self._apply_highlighting(editor, _MARKUP_TAGS, _MARKUP_PATTERNS,
+                                 start, end)
                 
-    def _update_vml_highlighting(self, editor):
-        """Update VML syntax highlighting"""
-        # Remove existing tags
-        vml_tags = ["vml_heading", "vml_directive", "vml_variable", 
-                   "vml_template", "vml_section", "vml_metadata"]
-        for tag in vml_tags:
-            editor.tag_remove(tag, "1.0", tk.END)
-            
-        content = editor.get("1.0", tk.END)
-        
-        # Highlight patterns
-        patterns = {
-            "vml_heading": r'^#{1,6}\s+.+$',
-            "vml_directive": r'@\w+(?:\[[^\]]*\])?',
-            "vml_variable": r'\$\{[^}]+\}',
-            "vml_template": r'%\{[^}]+\}',
-            "vml_section": r'^::\s*/?\\w+(?:\[[^\]]*\])?',
-            "vml_metadata": r'^---$',
-        }
-        
-        for tag_name, pattern in patterns.items():
-            for match in re.finditer(pattern, content, re.MULTILINE):
-                start_idx = f"1.0 + {match.start()} chars"
-                end_idx = f"1.0 + {match.end()} chars"
-                editor.tag_add(tag_name, start_idx, end_idx)
+    def _update_vml_highlighting(self, editor, start="1.0", end=tk.END):
+        """Update VML syntax highlighting between start and end"""
+        self._apply_highlighting(editor, _VML_TAGS, _VML_PATTERNS,
+                                 start, end)
+        
+    def _apply_highlighting(self, editor, tags, patterns, start, end):
+        """Re-tag a region of the editor from precompiled patterns"""
+        # Matches can span lines; grow the region over any tagged range
+        # crossing its edges so no match is left half-cleared
+        for tag in tags:
+            before = editor.tag_prevrange(tag, start)
+            if before and editor.compare(before[1], ">", start):
+                start = before[0]
+            after = editor.tag_prevrange(tag, end)
+            if after and editor.compare(after[1], ">", end):
+                end = after[1]
+        start = editor.index(f"{start} linestart")
+        
+        for tag in tags:
+            editor.tag_remove(tag, start, end)
+            
+        content = editor.get(start, end)
+        
+        # Map match offsets to "line.col" directly instead of making Tk
+        # count characters from the region start for every index
+        first_line = int(editor.index(start).split('.')[0])
+        line_starts = [0]
+        for line in content.split("\n"):
+            line_starts.append(line_starts[-1] + len(line) + 1)
+            
+        def idx(offset):
+            i = bisect_right(line_starts, offset) - 1
+            return f"{first_line + i}.{offset - line_starts[i]}"
+        
+        ranges: Dict[str, List[str]] = defaultdict(list)
+        for tag_name, pattern in patterns:
+            for match in pattern.finditer(content):
+                ranges[tag_name] += (idx(match.start()), idx(match.end()))
+                
+        # One Tcl call per tag; tag_add accepts interleaved start/end pairs
+        for tag_name, tag_ranges in ranges.items():
+            editor.tag_add(tag_name, *tag_ranges)
                 
     def _check_api_status(self):
         """Check API availability"""
-        if ANTHROPIC_AVAILABLE and os.getenv("ANTHROPIC_API_KEY"):
+        if os.getenv("ANTHROPIC_API_KEY") and _anthropic_available():
             self.api_status_var.set("API: Connected")
             self.api_status_label.configure(foreground=self.colors['success'])
         else:
@@ -1401,9 +2131,23 @@ Click "Convert" to see this text converted to your selected format.
 
 /+Happy converting!+/
 """
-        self.main_editor.insert("1.0", welcome_text)
+        self._load_editor_content(self.main_editor, welcome_text)
         self.modified = False
         
+    def _load_editor_content(self, editor, content):
+        """Replace editor content without marking the document modified"""
+        editor.delete("1.0", tk.END)
+        editor.insert("1.0", content)
+        # <<Modified>> is queued, not sent; clearing the flag now makes the
+        # pending handler see an unmodified editor and ignore the load
+        editor.edit_modified(False)
+        
+        # The cursor-local pass would miss most of a loaded document
+        highlighter = self._highlighters.get(str(editor))
+        if highlighter:
+            self._hl_line_counts.pop(str(editor), None)
+            highlighter(editor)
+        
     # File operations
     def _new_file(self):
         """Create new file"""
@@ -1418,9 +2162,8 @@ Click "Convert" to see this text converted to your selected format.
                 return
                 
         # Clear all editors
-        self.main_editor.delete("1.0", tk.END)
-        self.markup_editor.delete("1.0", tk.END)
-        self.vml_editor.delete("1.0", tk.END)
+        for editor in (self.main_editor, self.markup_editor, self.vml_editor):
+            self._load_editor_content(editor, "")
         self.output_text.config(state=tk.NORMAL)
         self.output_text.delete("1.0", tk.END)
         self.output_text.config(state=tk.DISABLED)
@@ -1452,12 +2195,10 @@ Click "Convert" to see this text converted to your selected format.
                 ext = Path(file_path).suffix.lower()
                 if ext == '.vml':
                     self.editor_notebook.select(2)  # VML tab
-                    self.vml_editor.delete("1.0", tk.END)
-                    self.vml_editor.insert("1.0", content)
+                    self._load_editor_content(self.vml_editor, content)
                 else:
                     self.editor_notebook.select(0)  # Main editor tab
-                    self.main_editor.delete("1.0", tk.END)
-                    self.main_editor.insert("1.0", content)
+                    self._load_editor_content(self.main_editor, content)
                     
                     # Set language based on extension
                     lang_map = {
@@ -1606,6 +2347,7 @@ Click "Convert" to see this text converted to your selected format.
                 
         # Save configuration
         self.config.save()
+        self.engine.cache.flush()
         
         # Clean up
         self.root.quit()
@@ -2070,9 +2812,7 @@ EXAMPLES
         for entry in self.conversion_history:
             if entry['id'] == history_id:
                 # Load input
-                editor = self._get_current_editor()
-                editor.delete("1.0", tk.END)
-                editor.insert("1.0", entry['input'])
+                self._load_editor_content(self._get_current_editor(), entry['input'])
                 
                 # Load output
                 self.output_text.config(state=tk.NORMAL)
@@ -2146,26 +2886,23 @@ Conversions by Type:
             
     def _apply_editor_preferences(self):
         """Apply editor preferences from config"""
-        font_family = self.config.get('Editor', 'font_family', 'Consolas')
-        font_size = self.config.get_int('Editor', 'font_size', 11)
+        self._editor_font = (self.config.get('Editor', 'font_family', 'Consolas'),
+                             self.config.get_int('Editor', 'font_size', 11))
         
         # Update all editors
         for editor in [self.main_editor, self.markup_editor, self.vml_editor]:
-            editor.configure(font=(font_family, font_size))
+            editor.configure(font=self._editor_font)
             
     def _clear_cache(self):
         """Clear conversion cache"""
         if messagebox.askyesno("Clear Cache", "Are you sure you want to clear the conversion cache?"):
             # Clear cache through engine
-            cache_file = self.engine.cache.cache_path
-            if cache_file.exists():
-                try:
-                    cache_file.unlink()
-                    self.engine.cache._init_db()
-                    self.status_var.set("Cache cleared")
-                    messagebox.showinfo("Cache Cleared", "Conversion cache has been cleared.")
-                except Exception as e:
-                    messagebox.showerror("Error", f"Failed to clear cache: {str(e)}")
+            try:
+                self.engine.cache.clear()
+                self.status_var.set("Cache cleared")
+                messagebox.showinfo("Cache Cleared", "Conversion cache has been cleared.")
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to clear cache: {str(e)}")
                     
     def _show_plugin_manager(self):
         """Show plugin manager dialog"""
@@ -2614,7 +3351,7 @@ class ClaudeConverter(ConverterInterface):
         
     async def convert(self, input_text: str, context: ConversionContext) -> UnifiedConversionResult:
         """Convert using Claude API"""
-        if not ANTHROPIC_AVAILABLE:
+        if _get_anthropic() is None:
             return UnifiedConversionResult(
                 success=False,
                 output="",